@@ -7,29 +7,40 @@ import threading
 import subprocess
 import re
 import textwrap
+import copy
+import functools
+import importlib.util
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from stat import S_ISREG
+from operator import attrgetter
 from pathlib import Path
-from collections import deque
 
 class UploadCancelled(Exception):
     """Raised when a user cancels an active upload."""
     pass
 
 # ---------------- Dependency check (GUI-safe fallback) ----------------
+# Only tkinter is imported here; the SDK modules are located without executing
+# them and get imported later, off the startup path.
 required = ["tkinter", "minio", "urllib3", "tqdm"]
 missing = []
 for mod in required:
     try:
-        __import__(mod)
+        if mod == "tkinter":
+            __import__(mod)
+        elif importlib.util.find_spec(mod) is None:
+            missing.append(mod)
     except Exception:
         missing.append(mod)
 
 if missing:
+    pip_missing = " ".join(m for m in missing if m != "tkinter")
     try:
         import tkinter as tk
         from tkinter import messagebox
         _rt = tk.Tk()
         _rt.withdraw()
-        pip_missing = " ".join([m for m in missing if m != "tkinter"])
         msg = (
             "The following Python modules are missing:\n\n"
             + "\n".join(missing)
@@ -41,8 +52,8 @@ if missing:
         _rt.destroy()
     except Exception as e:
         print("ERROR: Missing modules:", ", ".join(missing))
-        if any(m for m in missing if m != "tkinter"):
-            print("Run: pip install", " ".join([m for m in missing if m != "tkinter"]))
+        if pip_missing:
+            print("Run: pip install", pip_missing)
         print("If 'tkinter' is missing, reinstall Python from python.org with Tcl/Tk support.")
         print(f"Extra info: {e}")
     sys.exit(1)
@@ -51,15 +62,15 @@ if missing:
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
 from tkinter import font as tkfont
-from minio import Minio
-from minio.error import S3Error
 #from s3 import get_client  # switch to "from s3 import get_client3 as get_client" for AWS-only env client
 from s3 import (
     get_client3 as get_client,
     load_settings as load_s3_settings,
     save_settings as save_s3_settings,
+    reset_client as reset_s3_client,
     CONFIG_PATH as S3_CONFIG_PATH,
 )
+import s3 as _s3
 from auth_store import (
     verify_user as auth_verify_user,
     create_user as auth_create_user,
@@ -70,7 +81,51 @@ from auth_store import (
 import secrets
 import datetime
 
-_initial_settings = load_s3_settings()
+# minio takes ~150 ms to import, so it is loaded by _load_minio() (prewarmed on
+# a background thread once the window is up, and on demand by each worker)
+# rather than before first paint. s3._load_sdk() does the import; until then
+# S3Error is s3's placeholder, so both modules catch the same type.
+Minio = None
+S3Error = _s3.S3Error
+DeleteObject = None
+HAS_USE_API = HAS_INCLUDE_VERSION = HAS_START_AFTER = HAS_BUCKET_LOOKUP = False
+
+def _load_minio():
+    global Minio, S3Error, DeleteObject, HAS_USE_API, HAS_INCLUDE_VERSION, HAS_START_AFTER
+    global HAS_BUCKET_LOOKUP
+    if Minio is not None:
+        return
+    _s3._load_sdk()
+    HAS_USE_API = _s3.HAS_USE_API
+    HAS_INCLUDE_VERSION = _s3.HAS_INCLUDE_VERSION
+    HAS_START_AFTER = _s3.HAS_START_AFTER
+    HAS_BUCKET_LOOKUP = _s3.HAS_BUCKET_LOOKUP
+    S3Error, DeleteObject = _s3.S3Error, _s3.DeleteObject
+    Minio = _s3.Minio
+
+# In-memory copy of the persisted settings, keyed by the file's mtime/size so
+# repeated reads (every S3 action) skip the open + json parse.
+_settings_cache = {"mtime": None, "data": None}
+
+def _settings_file_stamp():
+    try:
+        st = os.stat(S3_CONFIG_PATH)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+def _load_s3_settings_cached():
+    """Return persisted settings, re-reading the file only when it changed.
+    The returned dict is shared; callers that mutate it must copy first."""
+    stamp = _settings_file_stamp()
+    if _settings_cache["data"] is not None and stamp == _settings_cache["mtime"]:
+        return _settings_cache["data"]
+    data = load_s3_settings() if stamp is not None else {}
+    _settings_cache["mtime"] = stamp
+    _settings_cache["data"] = data
+    return data
+
+_initial_settings = copy.deepcopy(_load_s3_settings_cached())
 THEME_PALETTE = {}
 INPUT_MAX_WIDTH = 200
 HEADER_INFO_LABEL = None
@@ -1414,7 +1469,7 @@ def _start_login(root, card_factory):
 
     # Fast-path: auto login via session before creating overlays
     try:
-        cfg = load_s3_settings()
+        cfg = _load_s3_settings_cached()
         sess = (cfg or {}).get("SESSION") or {}
         username = sess.get("username")
         exp = sess.get("expires_at")
@@ -1698,10 +1753,12 @@ if 'create_dashboard' not in globals():
 
 # ---------------- Small helpers ----------------
 _BUCKET_RE = re.compile(r"^(?!-)[a-z0-9-]{3,63}(?<!-)$")
+_IPV4_RE = re.compile(r"^\d{1,3}(\.\d{1,3}){3}$")
+@functools.lru_cache(maxsize=64)
 def is_valid_bucket_name(name):
-    if not name or len(name) < 3 or len(name) > 63: return False
-    if not _BUCKET_RE.match(name): return False
-    if re.match(r"^\d{1,3}(\.\d{1,3}){3}$", name): return False
+    # _BUCKET_RE already enforces the 3–63 length bounds.
+    if not name or not _BUCKET_RE.match(name): return False
+    if _IPV4_RE.match(name): return False
     return True
 
 def human_eta(seconds_or_none):
@@ -1713,30 +1770,57 @@ def human_eta(seconds_or_none):
     if val <= 0:
         return "00:00:00"
     s = int(math.ceil(val))
-    return f"{s//3600:02d}:{(s%3600)//60:02d}:{s%60:02d}"
+    if s < 60:
+        return f"00:00:{s:02d}"
+    if s < 3600:
+        m, sec = divmod(s, 60)
+        return f"00:{m:02d}:{sec:02d}"
+    h, rem = divmod(s, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{sec:02d}"
+
+_SIZE_UNITS = ("", "K", "M", "G", "T", "P")
+_SIZE_DIVISORS = tuple(1 << (i * 10) for i in range(len(_SIZE_UNITS)))
 
 def human_size(num_bytes, suffix="B"):
+    # Speeds arrive as fresh floats every tick and would only churn the
+    # cache; any fractional part can change the rounded digit, so format
+    # them directly.
+    if isinstance(num_bytes, float) and not num_bytes.is_integer():
+        return _format_size(num_bytes, suffix)
+    return _human_size_cached(num_bytes, suffix)
+
+@functools.lru_cache(maxsize=8192)
+def _human_size_cached(num_bytes, suffix="B"):
+    return _format_size(num_bytes, suffix)
+
+def _format_size(num_bytes, suffix="B"):
     try:
         num = float(num_bytes)
     except (TypeError, ValueError):
         num = 0.0
-    for unit in ("", "K", "M", "G", "T", "P"):
-        if abs(num) < 1024.0 or unit == "P":
-            return f"{num:5.1f} {unit}{suffix}".strip()
-        num /= 1024.0
-    return f"{num:.1f} P{suffix}"
+    try:
+        whole = abs(int(num))
+    except (OverflowError, ValueError):  # inf / nan
+        whole = 1 << 50
+    # Unit index from the bit length (10 bits per step) instead of a divide loop.
+    k = min((whole.bit_length() - 1) // 10, 5) if whole >= 1024 else 0
+    if k:
+        num /= _SIZE_DIVISORS[k]
+    return f"{num:5.1f} {_SIZE_UNITS[k]}{suffix}".strip()
+
+# Per-label progress state cleared at the start/end of a transfer; all values
+# are immutable, so one dict update replaces the individual setattr calls.
+_EMPTY_METRICS_PROTO = {
+    "_speed_ring": None,
+    "_last_seen": -1,
+}
 
 def _reset_progress_metrics(*labels, reset_footer=False):
     for lbl in labels:
         if lbl is None:
             continue
-        try:
-            lbl._inst_ema = None
-            lbl._inst_samples = 0
-            lbl._avg_speed = 0.0
-            lbl._speed_hist = deque()
-        except Exception:
-            pass
+        lbl.__dict__.update(_EMPTY_METRICS_PROTO)
     if reset_footer:
         statusbar._last_upd = 0.0
 
@@ -1744,19 +1828,39 @@ def _wrap_lines(message, width_chars=80):
     text = "" if message is None else str(message)
     if width_chars <= 0:
         width_chars = 80
-    lines = []
-    for raw in text.splitlines() or [text]:
-        if not raw:
-            lines.append("")
-            continue
-        wrapped = textwrap.wrap(
-            raw,
+    # Short single-line text wraps to itself; isprintable() rules out tabs and
+    # every line break splitlines() would honour.
+    if len(text) <= width_chars and text.isprintable():
+        return text
+    return _wrap_text(text, width_chars)
+
+# One TextWrapper per width rather than a fresh one per textwrap.wrap() call.
+_WRAPPER_CACHE = {}
+
+def _text_wrapper(width_chars):
+    wrapper = _WRAPPER_CACHE.get(width_chars)
+    if wrapper is None:
+        if len(_WRAPPER_CACHE) >= 32:
+            _WRAPPER_CACHE.pop(next(iter(_WRAPPER_CACHE)))
+        wrapper = textwrap.TextWrapper(
             width=width_chars,
             replace_whitespace=False,
             drop_whitespace=False,
             break_long_words=False,
             break_on_hyphens=False,
         )
+        _WRAPPER_CACHE[width_chars] = wrapper
+    return wrapper
+
+@functools.lru_cache(maxsize=256)
+def _wrap_text(text, width_chars):
+    wrap = _text_wrapper(width_chars).wrap
+    lines = []
+    for raw in text.splitlines() or [text]:
+        if not raw:
+            lines.append("")
+            continue
+        wrapped = wrap(raw)
         if not wrapped:
             lines.append("")
         else:
@@ -1778,23 +1882,18 @@ def _estimate_char_width(widget, minimum=40):
         pass
     return max(minimum, 80)
 
-def _append_wrapped_text(widget, message):
-    if widget is None:
-        return
-    width = _estimate_char_width(widget)
-    text = _wrap_lines(message, width)
-    if isinstance(widget, tk.Text):
-        readonly = str(widget.cget("state")) == "disabled"
-        if readonly:
-            widget.config(state="normal")
-        widget.insert(tk.END, (text + "\n") if text else "\n")
-        if readonly:
-            widget.config(state="disabled")
-        widget.see(tk.END)
-    else:
-        widget.config(text=text or "")
-    _reset_progress_metrics(widget)
+def _cached_char_width(widget):
+    """_estimate_char_width, cached on the widget until it is resized."""
+    width = getattr(widget, "_char_width_cache", None)
+    if width is None:
+        if not getattr(widget, "_char_width_bound", False):
+            widget.bind("<Configure>", lambda e, w=widget: setattr(w, "_char_width_cache", None), add="+")
+            widget._char_width_bound = True
+        width = _estimate_char_width(widget)
+        widget._char_width_cache = width
+    return width
 
+@functools.lru_cache(maxsize=512)
 def _truncate_middle(text, max_len=72):
     if not text:
         return ""
@@ -1824,32 +1923,37 @@ def _center_window(win, fallback=(480, 320)):
     except Exception:
         pass
 
-def _format_transfer_meta(kind, name, transferred, total, avg_Bps, elapsed_sec, note=None):
+@functools.lru_cache(maxsize=32)
+def _transfer_meta_prefix(kind, name):
+    """Fixed '<kind>: <name>' head of the meta line; constant for a transfer."""
     display_name = _truncate_middle(name, 72)
-    parts = [f"{kind}: {display_name}" if display_name else kind]
+    return f"{kind}: {display_name}" if display_name else kind
 
-    if total:
-        pct = (transferred / total) * 100 if total else 0.0
-        parts.append(f"{human_size(transferred)} of {human_size(total)} ({pct:0.1f}%)")
-    else:
-        parts.append(f"{human_size(transferred)} transferred")
+def _format_transfer_meta(kind, name, transferred, total, avg_Bps, elapsed_sec, note=None):
+    prefix = _transfer_meta_prefix(kind, name)
 
-    if avg_Bps and avg_Bps > 1:
-        parts.append(f"Avg {human_size(avg_Bps)}/s")
+    if total:
+        pct = (transferred / total) * 100
+        size_part = f"{human_size(transferred)} of {human_size(total)} ({pct:0.1f}%)"
     else:
-        parts.append("Avg —")
+        size_part = f"{human_size(transferred)} transferred"
 
-    parts.append(f"Elapsed {human_eta(elapsed_sec)}")
+    avg_part = f"Avg {human_size(avg_Bps)}/s" if avg_Bps and avg_Bps > 1 else "Avg —"
 
+    text = f"{prefix}  |  {size_part}  |  {avg_part}  |  Elapsed {human_eta(elapsed_sec)}"
     if note:
-        parts.append(note)
-
-    return "  |  ".join(parts)
+        text += f"  |  {note}"
+    return text
 
 def _update_transfer_meta(label, kind, name, transferred, total, avg_Bps, elapsed_sec, note=None):
     if label is None:
         return
-    label.config(text=_format_transfer_meta(kind, name, transferred, total, avg_Bps, elapsed_sec, note))
+    # Plain progress ticks are capped at ~10 Hz; notes and completion always render.
+    now = time.monotonic()
+    if note is None and total and transferred < total and now - getattr(label, "_last_meta_update", 0.0) < 0.1:
+        return
+    label._last_meta_update = now
+    _set_label_text(label, _format_transfer_meta(kind, name, transferred, total, avg_Bps, elapsed_sec, note))
 
 def _set_initial_window_size(win, preferred=(1280, 780), minimum=(960, 600), margin=40):
     """Apply a compact default size while keeping the window resizable."""
@@ -1870,11 +1974,29 @@ def _set_initial_window_size(win, preferred=(1280, 780), minimum=(960, 600), mar
         win.geometry(f"{preferred[0]}x{preferred[1]}")
 
 # ---------------- Theme / Style ----------------
-def apply_theme(root):
-    style = ttk.Style(root)
-    try: style.theme_use("clam")
-    except tk.TclError: pass
+@functools.lru_cache(maxsize=256)
+def _blend_hex(color, target, ratio):
+    """Return a hex color blended towards target by ratio (0-1)."""
+    c = color.lstrip("#"); t = target.lstrip("#")
+    cr, cg, cb = int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)
+    tr, tg, tb = int(t[0:2], 16), int(t[2:4], 16), int(t[4:6], 16)
+    nr = int(cr + (tr - cr) * ratio)
+    ng = int(cg + (tg - cg) * ratio)
+    nb = int(cb + (tb - cb) * ratio)
+    return f"#{nr:02x}{ng:02x}{nb:02x}"
+
+# Installed font families, listed once per process; re-theming reuses the set.
+_AVAILABLE_FONTS = None
+
+def _get_available_fonts(root):
+    global _AVAILABLE_FONTS
+    if _AVAILABLE_FONTS is None:
+        _AVAILABLE_FONTS = set(tkfont.families(root))
+    return _AVAILABLE_FONTS
+
+_theme_state = {"key": None, "result": None}
 
+def apply_theme(root):
     # Read persisted preference first, then environment
     pref = None
     try:
@@ -1885,16 +2007,6 @@ def apply_theme(root):
     base = env_flag if env_flag is not None else (pref if pref is not None else "1")
     dark = str(base).lower() not in ("0", "false", "no")
 
-    def _blend_hex(color, target, ratio):
-        """Return a hex color blended towards target by ratio (0-1)."""
-        c = color.lstrip("#"); t = target.lstrip("#")
-        cr, cg, cb = int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)
-        tr, tg, tb = int(t[0:2], 16), int(t[2:4], 16), int(t[4:6], 16)
-        nr = int(cr + (tr - cr) * ratio)
-        ng = int(cg + (tg - cg) * ratio)
-        nb = int(cb + (tb - cb) * ratio)
-        return f"#{nr:02x}{ng:02x}{nb:02x}"
-
     if dark:
         BG      = "#0f1115"; SURFACE = "#171a20"; RAISED  = "#1f232b"
         TEXT    = "#eef1f7"; SUBTLE  = "#9aa3b2"; ACCENT  = "#5b8cfe"
@@ -1906,35 +2018,38 @@ def apply_theme(root):
         TEXTAREA_BG = "#ffffff"; STATUS_BG = "#eff2f9"
         TEXTAREA_BG = "#ffffff"; STATUS_BG = "#f4f6fb"
 
-    available_fonts = set(tkfont.families(root))
-
-    def pick_font(preferred, size, weight=None):
-        for fam in preferred:
-            if fam in available_fonts:
-                if weight:
-                    return (fam, size, weight)
-                return (fam, size)
-        fallback = preferred[-1] if preferred else "Arial"
-        if weight:
-            return (fallback, size, weight)
-        return (fallback, size)
+    available_fonts = _get_available_fonts(root)
 
     TEXT_STACK = ["SF Pro Text", "Segoe UI", "Helvetica Neue", "Helvetica", "Arial"]
     DISPLAY_STACK = ["SF Pro Display", "Segoe UI Semibold", "Helvetica Neue", "Helvetica", "Arial"]
-    FONT_TEXT = pick_font(TEXT_STACK, 12)
-    FONT_TEXT_BOLD = pick_font(TEXT_STACK, 12, "bold")
-    FONT_SMALL = pick_font(TEXT_STACK, 10)
-    FONT_SMALL_BOLD = pick_font(TEXT_STACK, 10, "bold")
-    FONT_HEADER = pick_font(DISPLAY_STACK, 16, "bold")
-    FONT_HERO = pick_font(DISPLAY_STACK, 26, "bold")
-    FONT_BADGE = pick_font(TEXT_STACK, 9, "bold")
-    FONT_PROGRESS = pick_font(TEXT_STACK, 11, "bold")
-    FONT_ICON = pick_font(DISPLAY_STACK, 24, "bold")
+    # First installed family per stack, resolved once; the last entry is the fallback.
+    text_fam = next((f for f in TEXT_STACK if f in available_fonts), TEXT_STACK[-1])
+    display_fam = next((f for f in DISPLAY_STACK if f in available_fonts), DISPLAY_STACK[-1])
+    FONT_TEXT = (text_fam, 12)
+    FONT_TEXT_BOLD = (text_fam, 12, "bold")
+    FONT_SMALL = (text_fam, 10)
+    FONT_SMALL_BOLD = (text_fam, 10, "bold")
+    FONT_HEADER = (display_fam, 16, "bold")
+    FONT_HERO = (display_fam, 26, "bold")
+    FONT_BADGE = (text_fam, 9, "bold")
+    FONT_PROGRESS = (text_fam, 11, "bold")
+    FONT_ICON = (display_fam, 24, "bold")
     ACCENT_GLOW = _blend_hex(ACCENT, "#ffffff", 0.35)
     ACCENT_SHADOW = _blend_hex(ACCENT, "#000000", 0.25)
     INPUT_BG = _blend_hex(SURFACE, BG, 0.22 if dark else 0.06)
     INPUT_BG_FOCUS = _blend_hex(INPUT_BG, ACCENT, 0.35)
 
+    # Same mode and fonts as the last pass (e.g. UI_DARK pinned in the
+    # environment): the styles are already in place, skip the restyle.
+    theme_key = (str(root), dark, text_fam, display_fam)
+    if _theme_state["key"] == theme_key:
+        card, palette = _theme_state["result"]
+        return card, dict(palette)
+
+    style = ttk.Style(root)
+    try: style.theme_use("clam")
+    except tk.TclError: pass
+
     root.configure(bg=BG)
     style.configure(".", background=BG, foreground=TEXT, fieldbackground=SURFACE, highlightthickness=0)
     style.configure("TLabel", background=BG, foreground=TEXT, font=FONT_TEXT)
@@ -1972,7 +2087,7 @@ def apply_theme(root):
         bordercolor=[("active", _blend_hex(ghost_bg_active, ACCENT, 0.2))]
     )
     # Larger primary and smaller ghost variants for auth actions
-    style.configure("PrimaryLarge.TButton", padding=(20,14), font=pick_font(DISPLAY_STACK, 14, "bold"),
+    style.configure("PrimaryLarge.TButton", padding=(20,14), font=(display_fam, 14, "bold"),
                     background=accent_idle, foreground="white", borderwidth=0)
     style.map("PrimaryLarge.TButton", background=[("active", accent_active)])
     style.configure("GhostSmall.TButton", padding=(8,6), font=FONT_TEXT,
@@ -2301,9 +2416,11 @@ def apply_theme(root):
         "HERO_GRADIENT": (hero_top, hero_bottom),
         "CARD_SHADOW": _blend_hex(BG, "#000000", 0.35 if dark else 0.2),
     }
-    return card, palette
+    _theme_state["key"] = theme_key
+    _theme_state["result"] = (card, palette)
+    return card, dict(palette)
 
-_initial_settings = load_s3_settings()
+_initial_settings = copy.deepcopy(_load_s3_settings_cached())
 
 # ---------------- GUI root ----------------
 root = tk.Tk()
@@ -2374,25 +2491,86 @@ statusbar = ttk.Label(root, text="Ready", style="Small.TLabel", anchor="w")
 statusbar.pack(fill="x", padx=16, pady=(0,12))
 
 cancel_event = threading.Event()
+ls_cancel_event = threading.Event()  # separate so listing can't cancel/un-cancel a transfer
 PADX = 10; PADY = 8
 _layout_state = {"compact": False, "settings_compact": False}
 
+# Trailing-edge debounce for Tk variable traces: a burst of keystrokes/pastes
+# collapses into one call of fn once input has been quiet for `delay` ms.
+_debounce_pending = {}
+
+def _debounce(fn, key, delay=80):
+    pending = _debounce_pending.pop(key, None)
+    if pending is not None:
+        try:
+            root.after_cancel(pending[0])
+        except Exception:
+            pass
+
+    def _fire():
+        _debounce_pending.pop(key, None)
+        fn()
+
+    _debounce_pending[key] = (root.after(delay, _fire), fn)
+
+def _debounce_cancel(key):
+    pending = _debounce_pending.pop(key, None)
+    if pending is not None:
+        try:
+            root.after_cancel(pending[0])
+        except Exception:
+            pass
+
+def _set_var(var, value):
+    # Tk redraws bound labels on every set, even when the text is unchanged.
+    if var.get() != value:
+        var.set(value)
+
+def _set_label_text(label, text):
+    # Python-side copy of the last text; skips the configure (and redraw) when
+    # one field of a multi-label summary changed.
+    if getattr(label, "_text", None) != text:
+        label.config(text=text)
+        label._text = text
+
+def _debounce_flush():
+    """Run any pending debounced callbacks immediately."""
+    for key in list(_debounce_pending):
+        pending = _debounce_pending.pop(key, None)
+        if pending is None:
+            continue
+        try:
+            root.after_cancel(pending[0])
+        except Exception:
+            pass
+        try:
+            pending[1]()
+        except Exception:
+            root.report_callback_exception(*sys.exc_info())
+
 def _settings_bool(value, default=True):
     if value is None:
         return default
     return str(value).lower() not in ("0", "false", "no")
 
+@functools.lru_cache(maxsize=64)
 def _default_endpoint(region: str) -> str:
     region = (region or "").strip()
     return f"s3.{region}.amazonaws.com" if region else ""
 
 
-def _display_config_path() -> str:
+def _compute_display_config_path() -> str:
     try:
         return "~/" + str(S3_CONFIG_PATH.relative_to(Path.home()))
     except Exception:
         return str(S3_CONFIG_PATH)
 
+# The config path is fixed for the process; resolve Path.home() once.
+_DISPLAY_CONFIG_PATH = _compute_display_config_path()
+
+def _display_config_path() -> str:
+    return _DISPLAY_CONFIG_PATH
+
 cfg_region = tk.StringVar(value=_initial_settings.get("AWS_REGION", ""))
 cfg_access_key = tk.StringVar(value=_initial_settings.get("AWS_ACCESS_KEY_ID", ""))
 cfg_secret_key = tk.StringVar(value=_initial_settings.get("AWS_SECRET_ACCESS_KEY", ""))
@@ -2405,6 +2583,15 @@ cfg_secure = tk.BooleanVar(value=_settings_bool(_initial_settings.get("AWS_S3_SE
 cfg_status = tk.StringVar(value="")
 PROVIDER_AWS = "aws"
 PROVIDER_MINIO = "minio"
+
+# Required (label, settings key) pairs, keyed by (is_aws, needs_endpoint).
+_REQUIRED_KEYS = (("Access Key ID", "AWS_ACCESS_KEY_ID"), ("Secret Access Key", "AWS_SECRET_ACCESS_KEY"))
+_REQUIRED_FIELDS = {
+    (True, False): (("AWS Region", "AWS_REGION"),) + _REQUIRED_KEYS,
+    (True, True): (("AWS Region", "AWS_REGION"),) + _REQUIRED_KEYS + (("Endpoint", "AWS_S3_ENDPOINT"),),
+    (False, False): _REQUIRED_KEYS,
+    (False, True): _REQUIRED_KEYS + (("Endpoint", "AWS_S3_ENDPOINT"),),
+}
 cfg_provider = tk.StringVar(value=_initial_settings.get("PROVIDER", PROVIDER_AWS))
 cfg_test_status = tk.StringVar(value="")
 if cfg_provider.get() == PROVIDER_MINIO and use_custom_flag is None:
@@ -2414,6 +2601,7 @@ if cfg_provider.get() == PROVIDER_MINIO and use_custom_flag is None:
 cfg_path_style = tk.BooleanVar(value=_settings_bool(_initial_settings.get("AWS_S3_PATH_STYLE"), False))
 cfg_show_secret = tk.BooleanVar(value=False)
 
+@functools.lru_cache(maxsize=4)
 def _provider_display_name(provider: str) -> str:
     return "AWS" if provider == PROVIDER_AWS else "MinIO / Custom"
 
@@ -2490,7 +2678,7 @@ def _refresh_configuration_status(saved_at=None):
     if saved_at:
         message += f" • saved {saved_at}"
 
-    cfg_status.set(message)
+    _set_var(cfg_status, message)
 
 # =============== UPLOAD TAB ===============
 upload_tab = ttk.Frame(notebook)
@@ -2551,6 +2739,7 @@ def pick_upload_file():
         return
 
     # set the path field
+    _upload_file_stat_cache["path"] = None
     try:
         up_file.set(f)
     except Exception:
@@ -2778,9 +2967,11 @@ dl_btn_start.pack(side="right", padx=6)
 d_status_title.grid(row=0, column=0, sticky="w")
 d_status_hint.grid(row=1, column=0, sticky="we", pady=(4,12))
 d_status_body.grid(row=2, column=0, sticky="nsew")
-dl_metrics.pack(fill="x")
-dl_progress_frame.pack(fill="x", pady=(16,0))
-d_btns.pack(fill="x", pady=(16,0))
+# Grid, not pack: the progress row resizes on every tick and d_status_body
+# already uses a weighted grid column.
+dl_metrics.grid(row=0, column=0, sticky="ew")
+dl_progress_frame.grid(row=1, column=0, sticky="ew", pady=(16,0))
+d_btns.grid(row=2, column=0, sticky="ew", pady=(16,0))
 # =============== LIST TAB ===============
 ls_tab = ttk.Frame(notebook)
 notebook.add(ls_tab, text="📄 List")
@@ -2789,6 +2980,7 @@ l_card = card(ls_tab); l_card.pack(fill="both", expand=True)
 ls_bucket = tk.StringVar()
 ls_prefix = tk.StringVar()
 ls_recursive = tk.BooleanVar(value=True)
+ls_load_limit = tk.IntVar(value=10000)
 
 l_callout = ttk.Frame(l_card, style="AccentCallout.TFrame", padding=(18,16))
 l_callout.grid_columnconfigure(1, weight=1)
@@ -2828,8 +3020,18 @@ l_chk_recursive = ttk.Checkbutton(
     style="Section.TCheckbutton"
 )
 
+l_paging = ttk.Frame(l_form_section, style="SectionToolbar.TFrame")
+l_lbl_load_limit = ttk.Label(l_paging, text="Objects per load", style="SectionLabel.TLabel")
+l_ent_load_limit = ttk.Entry(l_paging, textvariable=ls_load_limit, width=7)
+l_lbl_load_limit.pack(side="left")
+l_ent_load_limit.pack(side="left", padx=(8, 0))
+
 l_actions = ttk.Frame(l_form_section, style="SectionToolbar.TFrame")
 ls_btn = ttk.Button(l_actions, text="List Objects", style="Accent.TButton")
+ls_btn_more = ttk.Button(l_actions, text="Load more", style="Neutral.TButton", state="disabled")
+ls_btn_cancel = ttk.Button(l_actions, text="Cancel", style="Neutral.TButton", state="disabled")
+ls_btn_cancel.pack(side="right", padx=(6, 0))
+ls_btn_more.pack(side="right", padx=(6, 0))
 ls_btn.pack(side="right")
 
 l_form_title.grid(row=0, column=0, columnspan=2, sticky="w")
@@ -2840,7 +3042,8 @@ l_ent_bucket.grid(row=3, column=1, sticky="we", pady=(0,4), padx=(12,0))
 l_lbl_prefix.grid(row=4, column=0, sticky="w", pady=(8,4))
 l_ent_prefix.grid(row=4, column=1, sticky="we", pady=(8,4), padx=(12,0))
 l_chk_recursive.grid(row=5, column=0, columnspan=2, sticky="w", pady=(16,0))
-l_actions.grid(row=6, column=0, columnspan=2, sticky="e", pady=(16,0))
+l_paging.grid(row=6, column=0, columnspan=2, sticky="w", pady=(12,0))
+l_actions.grid(row=7, column=0, columnspan=2, sticky="e", pady=(16,0))
 
 l_results_section = ttk.Frame(l_card, style="Section.TFrame", padding=(18,16))
 l_results_section.grid_columnconfigure(0, weight=1)
@@ -2877,8 +3080,11 @@ ls_output_scroll_y.grid(row=0, column=1, sticky="ns")
 ls_output_scroll_x.grid(row=1, column=0, sticky="we")
 ls_output_frame.grid_rowconfigure(0, weight=1)
 ls_output_frame.grid_columnconfigure(0, weight=1)
+# Named fonts are resolved once by Tk and shared by every user.
+_STATUS_TEXT_FONT = tkfont.Font(root=root, family="SF Pro Text", size=11)
+_LIST_ERROR_FONT = tkfont.Font(root=root, family="SF Pro Text", size=12, weight="bold")
 ls_tree.tag_configure("muted", foreground="#9aa2ad")
-ls_tree.tag_configure("error", foreground="#ff6b6b", font=("SF Pro Text", 12, "bold"))
+ls_tree.tag_configure("error", foreground="#ff6b6b", font=_LIST_ERROR_FONT)
 ls_tree.tag_configure("info", foreground=palette["ACCENT"])
 
 ls_summary = ttk.Label(l_results_body, text="Ready", style="SectionHint.TLabel", justify="left", anchor="w")
@@ -2968,7 +3174,7 @@ do_status_text = tk.Text(
     height=8,
     wrap="word",
     relief="flat",
-    font=("SF Pro Text", 11)
+    font=_STATUS_TEXT_FONT
 )
 do_status_text.config(state="disabled")
 
@@ -3056,7 +3262,7 @@ db_status_text = tk.Text(
     wrap="word",
     height=12,
     relief="flat",
-    font=("SF Pro Text", 11)
+    font=_STATUS_TEXT_FONT
 )
 db_status_text.config(state="disabled")
 
@@ -3219,51 +3425,54 @@ s_info_section.pack(fill="x", pady=(0, PADY))
 s_bottom_spacer = ttk.Frame(s_card, style="Section.TFrame", height=28)
 s_bottom_spacer.pack(fill="x", pady=(0, 6))
 
-for widget, background in (
-    (do_status_text, palette["STATUS_BG"]),
-    (db_status_text, palette["STATUS_BG"]),
-):
-    widget.configure(
-        bg=background,
-        fg=palette["TEXTAREA_FG"],
-        insertbackground=palette["TEXTAREA_FG"],
-        highlightthickness=0,
-        borderwidth=0,
-    )
+_textarea_fg = palette["TEXTAREA_FG"]
+_status_text_opts = dict(
+    bg=palette["STATUS_BG"],
+    fg=_textarea_fg,
+    insertbackground=_textarea_fg,
+    highlightthickness=0,
+    borderwidth=0,
+)
+for widget in (do_status_text, db_status_text):
+    widget.configure(**_status_text_opts)
 
 # ---------------- Responsive layout engine ----------------
+_GRID_DEFAULTS = {"columnspan": 1, "rowspan": 1, "sticky": "", "padx": 0, "pady": 0}
+_settings_gridded = {}  # widget -> grid options it is currently shown with
+_SETTINGS_FORM_WIDGETS = (
+    s_form_title,
+    s_form_hint,
+    s_form_sep,
+    s_lbl_provider,
+    s_provider_opts,
+    s_lbl_region,
+    s_ent_region,
+    s_region_hint,
+    s_chk_custom_endpoint,
+    s_lbl_endpoint,
+    s_ent_endpoint,
+    s_endpoint_hint,
+    s_lbl_access,
+    s_ent_access,
+    s_access_hint,
+    s_lbl_secret,
+    s_secret_frame,
+    s_secret_hint,
+    path_style_row,
+    https_row,
+    s_actions,
+)
+
 def layout_settings_form(compact=False):
     _layout_state["settings_compact"] = compact
     provider_now = cfg_provider.get()
 
-    to_reset = [
-        s_form_title,
-        s_form_hint,
-        s_form_sep,
-        s_lbl_provider,
-        s_provider_opts,
-        s_lbl_region,
-        s_ent_region,
-        s_region_hint,
-        s_chk_custom_endpoint,
-        s_lbl_endpoint,
-        s_ent_endpoint,
-        s_endpoint_hint,
-        s_lbl_access,
-        s_ent_access,
-        s_access_hint,
-        s_lbl_secret,
-        s_secret_frame,
-        s_secret_hint,
-        path_style_row,
-        https_row,
-        s_actions,
-    ]
-    for widget in to_reset:
-        try:
-            widget.grid_forget()
-        except Exception:
-            pass
+    # Collect the target grid options and only touch widgets whose position
+    # changed; every Tk grid call triggers a geometry pass.
+    placed = {}
+
+    def place(widget, **kw):
+        placed[widget] = kw
 
     if compact:
         s_form_section.grid_columnconfigure(0, weight=1)
@@ -3275,40 +3484,40 @@ def layout_settings_form(compact=False):
         s_form_section.grid_columnconfigure(2, weight=1)
 
     row = 0
-    s_form_title.grid(row=row, column=0, columnspan=3, sticky="w")
+    place(s_form_title, row=row, column=0, columnspan=3, sticky="w")
     row += 1
-    s_form_hint.grid(row=row, column=0, columnspan=3, sticky="we", pady=(4, 12))
+    place(s_form_hint, row=row, column=0, columnspan=3, sticky="we", pady=(4, 12))
     row += 1
-    s_form_sep.grid(row=row, column=0, columnspan=3, sticky="we", pady=(0, 16))
+    place(s_form_sep, row=row, column=0, columnspan=3, sticky="we", pady=(0, 16))
     row += 1
 
     def add_row(label=None, control=None, hint=None, *, full=False, pady=(0, 4), control_sticky="we"):
         nonlocal row
         if compact:
             if label is not None:
-                label.grid(row=row, column=0, columnspan=3, sticky="w", pady=pady)
+                place(label, row=row, column=0, columnspan=3, sticky="w", pady=pady)
                 row += 1
             if control is not None:
-                control.grid(row=row, column=0, columnspan=3, sticky=control_sticky, pady=(0, 4))
+                place(control, row=row, column=0, columnspan=3, sticky=control_sticky, pady=(0, 4))
                 row += 1
             if hint is not None:
-                hint.grid(row=row, column=0, columnspan=3, sticky="we", pady=(4, 0))
+                place(hint, row=row, column=0, columnspan=3, sticky="we", pady=(4, 0))
                 row += 1
             return
 
         if full or label is None:
             if label is not None:
-                label.grid(row=row, column=0, columnspan=3, sticky="w", pady=pady)
+                place(label, row=row, column=0, columnspan=3, sticky="w", pady=pady)
                 row += 1
             if control is not None:
-                control.grid(row=row, column=0, columnspan=3, sticky=control_sticky, pady=pady)
+                place(control, row=row, column=0, columnspan=3, sticky=control_sticky, pady=pady)
                 row += 1
             if hint is not None:
-                hint.grid(row=row, column=0, columnspan=3, sticky="we", pady=(4, 0))
+                place(hint, row=row, column=0, columnspan=3, sticky="we", pady=(4, 0))
                 row += 1
             return
 
-        label.grid(row=row, column=0, sticky="w", pady=pady)
+        place(label, row=row, column=0, sticky="w", pady=pady)
         if control is not None:
             span = 2 if hint is None else 1
         try:
@@ -3316,43 +3525,39 @@ def layout_settings_form(compact=False):
                 return
         except Exception:
             pass
-        control.grid(row=row, column=1, columnspan=span, sticky=control_sticky, pady=pady, padx=(16,0))
+        place(control, row=row, column=1, columnspan=span, sticky=control_sticky, pady=pady, padx=(16,0))
         if hint is not None:
-            hint.grid(row=row, column=2, sticky="w", pady=pady, padx=(12, 0))
+            place(hint, row=row, column=2, sticky="w", pady=pady, padx=(12, 0))
         row += 1
 
     add_row(s_lbl_provider, s_provider_opts, control_sticky="w")
     add_row(s_lbl_region, s_ent_region, s_region_hint, pady=(8, 4))
     # Provider-specific rows
+    # The custom-endpoint checkbox is never shown; AWS hides the endpoint row too.
     if provider_now == PROVIDER_MINIO:
-        # Always show endpoint for MinIO; hide the custom-endpoint checkbox
-        try:
-            s_chk_custom_endpoint.grid_remove()
-        except Exception:
-            pass
         add_row(s_lbl_endpoint, s_ent_endpoint, s_endpoint_hint, pady=(8, 4))
-    else:
-        # AWS: hide endpoint inputs and the custom-endpoint checkbox
-        try:
-            s_chk_custom_endpoint.grid_remove()
-        except Exception:
-            pass
-        try:
-            s_lbl_endpoint.grid_remove()
-            s_ent_endpoint.grid_remove()
-            s_endpoint_hint.grid_remove()
-        except Exception:
-            pass
     add_row(s_lbl_access, s_ent_access, s_access_hint, pady=(8, 4))
     add_row(s_lbl_secret, s_secret_frame, s_secret_hint, pady=(8, 4))
     if provider_now == PROVIDER_MINIO:
-        path_style_row.grid_remove()
-        https_row.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(12,0))
+        place(https_row, row=row, column=0, columnspan=3, sticky="ew", pady=(12,0))
         row += 1
-    else:
-        path_style_row.grid_remove()
-        https_row.grid_remove()
-    s_actions.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(16, 0))
+    place(s_actions, row=row, column=0, columnspan=3, sticky="ew", pady=(16, 0))
+
+    # Only this function grids these widgets, so _settings_gridded is the
+    # source of truth and no winfo_manager round-trips are needed.
+    for widget in _SETTINGS_FORM_WIDGETS:
+        kw = placed.get(widget)
+        current = _settings_gridded.get(widget)
+        if kw is None:
+            if current is not None:
+                widget.grid_remove()
+                del _settings_gridded[widget]
+            continue
+        # Spell out every option so a re-grid never keeps a stale padx/span.
+        spec = dict(_GRID_DEFAULTS, **kw)
+        if current != spec:
+            widget.grid(**spec)
+            _settings_gridded[widget] = spec
 
 def grid_config(frame, cols):
     try:
@@ -3365,107 +3570,114 @@ def grid_config(frame, cols):
     for c in range(cols):
         frame.columnconfigure(c, weight=1)
 
+# Per-tab section triples and the card rows a relayout clears; built once
+# since the widgets never change.
+_UPLOAD_SECTIONS = (u_callout, u_form_section, u_status_section)
+_DOWNLOAD_SECTIONS = (d_callout, d_form_section, d_status_section)
+_LIST_SECTIONS = (l_callout, l_form_section, l_results_section)
+_DELETE_OBJECT_SECTIONS = (do_callout, do_form_section, do_status_section)
+_DELETE_BUCKET_SECTIONS = (db_callout, db_form_section, db_status_section)
+_ZERO_ROWS = (0, 1, 2, 3)
+# Section padding shared by every layout_*; fixed, so built once.
+_PAD_L = (PADX, PADX // 2)
+_PAD_R = (PADX // 2, PADX)
+_PAD_TOP = (PADY, PADY)
+_PAD_BOT = (0, PADY)
+
+def _reset_sections(card, sections):
+    # grid forget and rowconfigure both take lists: one Tcl call each.
+    root.tk.call("grid", "forget", *sections)
+    if card is not None:
+        card.rowconfigure(_ZERO_ROWS, weight=0)
+
 def layout_upload(compact=False):
-    for w in (u_callout, u_form_section, u_status_section):
-        w.grid_forget()
-    for r in range(4):
-        u_card.rowconfigure(r, weight=0)
+    _reset_sections(u_card, _UPLOAD_SECTIONS)
     if compact:
         row = 0
-        u_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        u_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY)); row += 1
-        u_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY))
+        u_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        u_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT); row += 1
+        u_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT)
         u_card.rowconfigure(row, weight=1)
         grid_config(u_card, 1)
     else:
         row = 0
-        u_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        u_form_section.grid(row=row, column=0, sticky="nsew", padx=(PADX, PADX//2), pady=(0, PADY))
-        u_status_section.grid(row=row, column=1, sticky="nsew", padx=(PADX//2, PADX), pady=(0, PADY))
+        u_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        u_form_section.grid(row=row, column=0, sticky="nsew", padx=_PAD_L, pady=_PAD_BOT)
+        u_status_section.grid(row=row, column=1, sticky="nsew", padx=_PAD_R, pady=_PAD_BOT)
         u_card.rowconfigure(row, weight=1)
         grid_config(u_card, 2)
         u_card.columnconfigure(0, weight=1)
         u_card.columnconfigure(1, weight=3)
 
 def layout_download(compact=False):
-    for w in (d_callout, d_form_section, d_status_section):
-        w.grid_forget()
-    for r in range(4):
-        d_card.rowconfigure(r, weight=0)
+    _reset_sections(d_card, _DOWNLOAD_SECTIONS)
     if compact:
         row = 0
-        d_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        d_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY)); row += 1
-        d_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY))
+        d_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        d_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT); row += 1
+        d_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT)
         d_card.rowconfigure(row, weight=1)
         grid_config(d_card, 1)
     else:
         row = 0
-        d_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        d_form_section.grid(row=row, column=0, sticky="nsew", padx=(PADX, PADX//2), pady=(0, PADY))
-        d_status_section.grid(row=row, column=1, sticky="nsew", padx=(PADX//2, PADX), pady=(0, PADY))
+        d_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        d_form_section.grid(row=row, column=0, sticky="nsew", padx=_PAD_L, pady=_PAD_BOT)
+        d_status_section.grid(row=row, column=1, sticky="nsew", padx=_PAD_R, pady=_PAD_BOT)
         d_card.rowconfigure(row, weight=1)
         grid_config(d_card, 2)
         d_card.columnconfigure(0, weight=1)
         d_card.columnconfigure(1, weight=3)
 
 def layout_list(compact=False):
-    for w in (l_callout, l_form_section, l_results_section):
-        w.grid_forget()
-    for r in range(4):
-        l_card.rowconfigure(r, weight=0)
+    _reset_sections(l_card, _LIST_SECTIONS)
     if compact:
         row = 0
-        l_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        l_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY)); row += 1
-        l_results_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0, PADY))
+        l_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        l_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT); row += 1
+        l_results_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT)
         l_card.rowconfigure(row, weight=1)
         grid_config(l_card, 1)
     else:
         row = 0
-        l_callout.grid(row=row, column=0, columnspan=3, sticky="we", padx=PADX, pady=(PADY, PADY)); row += 1
-        l_form_section.grid(row=row, column=0, sticky="nsew", padx=(PADX, PADX//2), pady=(0, PADY))
-        l_results_section.grid(row=row, column=1, columnspan=2, sticky="nsew", padx=(PADX//2, PADX), pady=(0, PADY))
+        l_callout.grid(row=row, column=0, columnspan=3, sticky="we", padx=PADX, pady=_PAD_TOP); row += 1
+        l_form_section.grid(row=row, column=0, sticky="nsew", padx=_PAD_L, pady=_PAD_BOT)
+        l_results_section.grid(row=row, column=1, columnspan=2, sticky="nsew", padx=_PAD_R, pady=_PAD_BOT)
         l_card.rowconfigure(row, weight=1)
         grid_config(l_card, 3)
 
 def layout_delete_object(compact=False):
-    for w in (do_callout, do_form_section, do_status_section):
-        w.grid_forget()
-    for r in range(4):
-        do_card.rowconfigure(r, weight=0)
+    _reset_sections(do_card, _DELETE_OBJECT_SECTIONS)
     if compact:
         row = 0
-        do_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=(PADY, PADY)); row+=1
-        do_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0,PADY)); row+=1
-        do_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0,PADY))
+        do_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=_PAD_TOP); row+=1
+        do_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT); row+=1
+        do_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT)
         do_card.rowconfigure(row, weight=1)
         grid_config(do_card, 1)
     else:
         row = 0
-        do_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=(PADY, PADY)); row+=1
-        do_form_section.grid(row=row, column=0, sticky="nsew", padx=(PADX, PADX//2), pady=(0,PADY))
-        do_status_section.grid(row=row, column=1, sticky="nsew", padx=(PADX//2, PADX), pady=(0,PADY))
+        do_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=_PAD_TOP); row+=1
+        do_form_section.grid(row=row, column=0, sticky="nsew", padx=_PAD_L, pady=_PAD_BOT)
+        do_status_section.grid(row=row, column=1, sticky="nsew", padx=_PAD_R, pady=_PAD_BOT)
         do_card.rowconfigure(row, weight=1)
         grid_config(do_card, 2)
         do_card.columnconfigure(0, weight=1, uniform="delete_object_sections")
         do_card.columnconfigure(1, weight=1, uniform="delete_object_sections")
 
 def layout_delete_bucket(compact=False):
-    for w in (db_callout, db_form_section, db_status_section):
-        w.grid_forget()
+    _reset_sections(None, _DELETE_BUCKET_SECTIONS)
     if compact:
         row = 0
-        db_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=(PADY, PADY)); row+=1
-        db_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0,PADY)); row+=1
-        db_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=(0,PADY))
+        db_callout.grid(row=row, column=0, sticky="we", padx=PADX, pady=_PAD_TOP); row+=1
+        db_form_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT); row+=1
+        db_status_section.grid(row=row, column=0, sticky="nsew", padx=PADX, pady=_PAD_BOT)
         db_card.rowconfigure(row, weight=1)
         grid_config(db_card, 1)
     else:
         row = 0
-        db_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=(PADY, PADY)); row+=1
-        db_form_section.grid(row=row, column=0, sticky="nsew", padx=(PADX, PADX//2), pady=(0,PADY))
-        db_status_section.grid(row=row, column=1, sticky="nsew", padx=(PADX//2, PADX), pady=(0,PADY))
+        db_callout.grid(row=row, column=0, columnspan=2, sticky="we", padx=PADX, pady=_PAD_TOP); row+=1
+        db_form_section.grid(row=row, column=0, sticky="nsew", padx=_PAD_L, pady=_PAD_BOT)
+        db_status_section.grid(row=row, column=1, sticky="nsew", padx=_PAD_R, pady=_PAD_BOT)
         db_card.rowconfigure(row, weight=1)
         grid_config(db_card, 2)
         db_card.columnconfigure(0, weight=1, uniform="delete_bucket_sections")
@@ -3490,15 +3702,9 @@ def _update_endpoint_field(*_):
         s_ent_endpoint.config(state="disabled")
         derived = _default_endpoint(cfg_region.get())
         if derived:
-            s_endpoint_hint.config(
-                text=f"AWS endpoint derived from region: {derived}",
-                style="StatusInfo.TLabel",
-            )
+            _set_hint(s_endpoint_hint, f"AWS endpoint derived from region: {derived}", "StatusInfo.TLabel")
         else:
-            s_endpoint_hint.config(
-                text="AWS endpoint will be derived from the selected region.",
-                style="StatusInfo.TLabel",
-            )
+            _set_hint(s_endpoint_hint, "AWS endpoint will be derived from the selected region.", "StatusInfo.TLabel")
     else:
         s_ent_endpoint.config(state="normal")
         if provider == PROVIDER_MINIO and not cfg_endpoint.get().strip():
@@ -3506,7 +3712,7 @@ def _update_endpoint_field(*_):
         hint_value = cfg_endpoint.get().strip()
         if not hint_value:
             hint_value = "s3.<region>.amazonaws.com" if provider == PROVIDER_AWS else "play.min.io:9000"
-        s_endpoint_hint.config(text=f"Example: {hint_value}", style="SectionHint.TLabel")
+        _set_hint(s_endpoint_hint, f"Example: {hint_value}", "SectionHint.TLabel")
 
     _on_endpoint_change()
 
@@ -3543,12 +3749,12 @@ def _on_provider_change(*_):
         if not cfg_region.get().strip():
             cfg_region.set("us-east-1")
         s_lbl_region.config(text="Region")
-        s_region_hint.config(text="Example: us-east-1")
+        _set_hint(s_region_hint, "Example: us-east-1")
         cfg_secure.set(True)
     else:
         s_chk_custom_endpoint.state(["!disabled"])
         s_lbl_region.config(text="Region (optional)")
-        s_region_hint.config(text="Example: us-east-1 (leave blank to use server default)")
+        _set_hint(s_region_hint, "Example: us-east-1 (leave blank to use server default)")
         if not restored:
             cfg_region.set("")
             cfg_access_key.set("")
@@ -3572,7 +3778,7 @@ def _on_endpoint_change():
     pass
 
 def _set_test_status(message, style="StatusInfo.TLabel"):
-    cfg_test_status.set(message)
+    _set_var(cfg_test_status, message)
     s_test_status_label.config(style=style)
     if message:
         s_test_status_label.pack_configure(side="left", padx=(0,8))
@@ -3584,91 +3790,96 @@ REGION_RE = re.compile(r"^[a-z]{2}-[a-z0-9-]+-\d+$")
 ENDPOINT_RE = re.compile(r"^[A-Za-z0-9.-]+(:\d+)?$")
 
 
+# Last (text, style) written to each settings hint. Every writer goes through
+# _set_hint, so an unchanged verdict costs no Tcl call at all.
+_hint_state = {}
+
+def _set_hint(label, text, style=None):
+    prev = _hint_state.get(label)
+    if style is None:
+        style = prev[1] if prev else str(label.cget("style"))
+    if prev == (text, style):
+        return
+    label.config(text=text, style=style)
+    _hint_state[label] = (text, style)
+
 def _validate_fields(*_):
+    # A direct run (endpoint/provider refresh, save, load) covers any
+    # keystroke-debounced validation still waiting to fire.
+    _debounce_cancel("validate")
     provider = cfg_provider.get()
     region = cfg_region.get().strip()
     access = cfg_access_key.get().strip()
     secret = cfg_secret_key.get().strip()
     endpoint = cfg_endpoint.get().strip()
 
+    region_ok = bool(REGION_RE.match(region)) if region else False
     if provider == PROVIDER_AWS:
-        valid_region = bool(REGION_RE.match(region))
+        valid_region = region_ok
         if valid_region:
-            s_region_hint.config(text="✅ Region looks good (e.g., us-east-1)", style="Success.TLabel")
+            _set_hint(s_region_hint, "✅ Region looks good (e.g., us-east-1)", "Success.TLabel")
         else:
-            s_region_hint.config(text="🔴 Region required (e.g., us-east-1)", style="Error.TLabel")
+            _set_hint(s_region_hint, "🔴 Region required (e.g., us-east-1)", "Error.TLabel")
     else:
-        if region and not REGION_RE.match(region):
+        if region and not region_ok:
             valid_region = False
-            s_region_hint.config(text="🔴 Region format should look like us-east-1", style="Error.TLabel")
+            _set_hint(s_region_hint, "🔴 Region format should look like us-east-1", "Error.TLabel")
         else:
             valid_region = True
-            s_region_hint.config(text="✅ Region optional (leave blank to use server default)", style="Success.TLabel")
+            _set_hint(s_region_hint, "✅ Region optional (leave blank to use server default)", "Success.TLabel")
 
     # Endpoint validation
     require_custom = (provider == PROVIDER_MINIO) or cfg_custom_endpoint.get()
     if require_custom:
         valid_endpoint = bool(ENDPOINT_RE.match(endpoint))
         if valid_endpoint:
-            s_endpoint_hint.config(text=f"✅ Endpoint format looks good ({endpoint or ''})", style="Success.TLabel")
+            _set_hint(s_endpoint_hint, f"✅ Endpoint format looks good ({endpoint or ''})", "Success.TLabel")
         else:
-            s_endpoint_hint.config(text="🔴 Endpoint must be host[:port] (e.g., play.min.io:9000)", style="Error.TLabel")
+            _set_hint(s_endpoint_hint, "🔴 Endpoint must be host[:port] (e.g., play.min.io:9000)", "Error.TLabel")
     else:
         # AWS with derived endpoint from region
         if provider == PROVIDER_AWS:
             if region:
                 derived = _default_endpoint(region)
                 if derived:
-                    s_endpoint_hint.config(
-                        text=f"AWS endpoint derived from region: {derived}",
-                        style="StatusInfo.TLabel",
-                    )
+                    _set_hint(s_endpoint_hint, f"AWS endpoint derived from region: {derived}", "StatusInfo.TLabel")
                 else:
-                    s_endpoint_hint.config(
-                        text="Region set, endpoint will be derived automatically when needed.",
-                        style="StatusInfo.TLabel",
-                    )
+                    _set_hint(s_endpoint_hint, "Region set, endpoint will be derived automatically when needed.", "StatusInfo.TLabel")
                 valid_endpoint = True
             else:
-                s_endpoint_hint.config(
-                    text="Set a region to derive the AWS endpoint automatically.",
-                    style="Error.TLabel",
-                )
+                _set_hint(s_endpoint_hint, "Set a region to derive the AWS endpoint automatically.", "Error.TLabel")
                 valid_endpoint = False
         else:
-            s_endpoint_hint.config(
-                text="Custom endpoint required for this provider.",
-                style="Error.TLabel",
-            )
+            _set_hint(s_endpoint_hint, "Custom endpoint required for this provider.", "Error.TLabel")
             valid_endpoint = False
 
     if provider == PROVIDER_AWS:
         valid_access = 16 <= len(access) <= 128
         if valid_access:
-            s_access_hint.config(text="✅ Access key length looks good", style="Success.TLabel")
+            _set_hint(s_access_hint, "✅ Access key length looks good", "Success.TLabel")
         else:
-            s_access_hint.config(text="🔴 Access key must be 16–128 characters", style="Error.TLabel")
+            _set_hint(s_access_hint, "🔴 Access key must be 16–128 characters", "Error.TLabel")
 
         valid_secret = len(secret) >= 16
         if valid_secret:
-            s_secret_hint.config(text="✅ Secret key captured", style="Success.TLabel")
+            _set_hint(s_secret_hint, "✅ Secret key captured", "Success.TLabel")
         else:
-            s_secret_hint.config(text="🔴 Secret key must be at least 16 characters", style="Error.TLabel")
+            _set_hint(s_secret_hint, "🔴 Secret key must be at least 16 characters", "Error.TLabel")
     else:
         valid_access = len(access) >= 3
         if valid_access:
-            s_access_hint.config(text="✅ Access key captured", style="Success.TLabel")
+            _set_hint(s_access_hint, "✅ Access key captured", "Success.TLabel")
         else:
-            s_access_hint.config(text="🔴 Access key required for MinIO / custom", style="Error.TLabel")
+            _set_hint(s_access_hint, "🔴 Access key required for MinIO / custom", "Error.TLabel")
 
         valid_secret = len(secret) >= 8
         if valid_secret:
-            s_secret_hint.config(text="✅ Secret key captured", style="Success.TLabel")
+            _set_hint(s_secret_hint, "✅ Secret key captured", "Success.TLabel")
         else:
-            s_secret_hint.config(text="🔴 Secret key must be at least 8 characters", style="Error.TLabel")
+            _set_hint(s_secret_hint, "🔴 Secret key must be at least 8 characters", "Error.TLabel")
 
     can_test = all([valid_region, valid_endpoint, valid_access, valid_secret])
-    if not cfg_test_status.get().startswith("⏳"):
+    if not _settings_test["running"]:
         if can_test:
             s_btn_test.state(["!disabled"])
         else:
@@ -3677,7 +3888,26 @@ def _validate_fields(*_):
 
 
 
+# Bumped by a trace on every settings variable; lets _collect_settings() hand
+# back its previous dict (treat it as read-only) until a field actually changes.
+_settings_dirty = [0]
+_collected_settings_cache = {"dirty": None, "data": None}
+_effective_endpoint_cache = {"data": None, "value": None}
+
+def _mark_settings_dirty(*_):
+    _settings_dirty[0] += 1
+
+
 def _collect_settings():
+    cache = _collected_settings_cache
+    if cache["data"] is not None and cache["dirty"] == _settings_dirty[0]:
+        return cache["data"]
+    cache["dirty"] = _settings_dirty[0]
+    cache["data"] = _collect_settings_uncached()
+    return cache["data"]
+
+
+def _collect_settings_uncached():
     region = cfg_region.get().strip()
     provider = cfg_provider.get()
     use_custom = (provider == PROVIDER_MINIO) or cfg_custom_endpoint.get()
@@ -3695,6 +3925,16 @@ def _collect_settings():
 
 
 def _effective_endpoint(settings):
+    cache = _effective_endpoint_cache
+    if settings is cache["data"]:
+        return cache["value"]
+    value = _effective_endpoint_uncached(settings)
+    cache["data"] = settings
+    cache["value"] = value
+    return value
+
+
+def _effective_endpoint_uncached(settings):
     provider = settings.get("PROVIDER", PROVIDER_AWS)
     region = (settings.get("AWS_REGION") or "").strip()
     endpoint = (settings.get("AWS_S3_ENDPOINT") or "").strip()
@@ -3754,6 +3994,10 @@ def _apply_env_from_settings(settings):
 def _persist_settings():
     data = _collect_settings()
     save_s3_settings(data)
+    _settings_cache["data"] = copy.deepcopy(data)
+    _settings_cache["mtime"] = _settings_file_stamp()
+    _refresh_creds_state(_settings_cache["data"])
+    reset_s3_client()
     _apply_env_from_settings(data)
     return data
 
@@ -3761,14 +4005,7 @@ def _persist_settings():
 def _on_settings_save():
     data = _collect_settings()
     provider = data.get("PROVIDER", cfg_provider.get())
-    required_fields = [
-        ("Access Key ID", "AWS_ACCESS_KEY_ID"),
-        ("Secret Access Key", "AWS_SECRET_ACCESS_KEY"),
-    ]
-    if provider == PROVIDER_AWS:
-        required_fields.insert(0, ("AWS Region", "AWS_REGION"))
-    if data.get("USE_CUSTOM_ENDPOINT"):
-        required_fields.append(("Endpoint", "AWS_S3_ENDPOINT"))
+    required_fields = _REQUIRED_FIELDS[(provider == PROVIDER_AWS, bool(data.get("USE_CUSTOM_ENDPOINT")))]
     missing = [label for label, key in required_fields if not data.get(key)]
     if missing:
         statusbar.config(text="Cannot save: missing " + ", ".join(missing))
@@ -3785,18 +4022,39 @@ def _on_settings_save():
     return data
 
 
+# Fail-fast pool for the connection test, built on first use and reused per click.
+_test_http_pool = {"pool": None}
+
+def _get_test_http_pool():
+    if _test_http_pool["pool"] is None:
+        try:
+            from urllib3 import PoolManager, util as urllib3_util
+            _test_http_pool["pool"] = PoolManager(
+                timeout=urllib3_util.Timeout(connect=3.0, read=6.0),
+                retries=0,
+                maxsize=16,
+            )
+        except Exception:
+            return None
+    return _test_http_pool["pool"]
+
+
+# Set on the Tk thread when a connection test starts and cleared there when
+# its result is applied; save/provider switches reset the status text
+# mid-test, so the text can't serve as the guard.
+_settings_test = {"running": False}
+
+def _finish_settings_test():
+    _settings_test["running"] = False
+    s_btn_test.state(["!disabled"])
+    _validate_fields()
+
 def _on_settings_test():
+    if _settings_test["running"]:
+        return
     data = _collect_settings()
     provider = data.get("PROVIDER", cfg_provider.get())
-    required_fields = [
-        ("Access Key ID", "AWS_ACCESS_KEY_ID"),
-        ("Secret Access Key", "AWS_SECRET_ACCESS_KEY"),
-    ]
-    if provider == PROVIDER_AWS:
-        required_fields.insert(0, ("AWS Region", "AWS_REGION"))
-
-    if data.get("USE_CUSTOM_ENDPOINT"):
-        required_fields.append(("Endpoint", "AWS_S3_ENDPOINT"))
+    required_fields = _REQUIRED_FIELDS[(provider == PROVIDER_AWS, bool(data.get("USE_CUSTOM_ENDPOINT")))]
     missing = [label for label, key in required_fields if not data.get(key)]
     if missing:
         _set_test_status("🟠 Missing values: " + ", ".join(missing), "Error.TLabel")
@@ -3813,74 +4071,65 @@ def _on_settings_test():
     def run_test():
         start = time.perf_counter()
         try:
+            _load_minio()
             use_path = _settings_bool(data.get("AWS_S3_PATH_STYLE"), False)
             minio_kwargs = dict(
                 secure=_settings_bool(data.get("AWS_S3_SECURE"), True),
                 region=data["AWS_REGION"] or None,
             )
-            http_client = None
-            try:
-                from urllib3 import PoolManager, util
-            except Exception:
-                http_client = None
-            else:
-                try:
-                    http_client = PoolManager(
-                        timeout=util.Timeout(connect=3.0, read=6.0),
-                        retries=0,
-                    )
-                except Exception:
-                    http_client = None
-            if http_client is not None:
-                minio_kwargs["http_client"] = http_client
-            try:
-                # Newer MinIO SDKs (v7.2.5+) support `bucket_lookup`
-                client = Minio(
-                    endpoint_for_test,
-                    access_key=data["AWS_ACCESS_KEY_ID"],
-                    secret_key=data["AWS_SECRET_ACCESS_KEY"],
-                    bucket_lookup=("path" if use_path else "auto"),
-                    **minio_kwargs,
-                )
-            except TypeError:
-                # Older SDKs do not accept `bucket_lookup`; fall back to defaults
-                client = Minio(
-                    endpoint_for_test,
-                    access_key=data["AWS_ACCESS_KEY_ID"],
-                    secret_key=data["AWS_SECRET_ACCESS_KEY"],
-                    **minio_kwargs,
-                )
+            test_pool = _get_test_http_pool()
+            if test_pool is not None:
+                minio_kwargs["http_client"] = test_pool
+            # Older SDKs do not accept `bucket_lookup`; fall back to defaults
+            if HAS_BUCKET_LOOKUP:
+                minio_kwargs["bucket_lookup"] = "path" if use_path else "auto"
+            client = Minio(
+                endpoint_for_test,
+                access_key=data["AWS_ACCESS_KEY_ID"],
+                secret_key=data["AWS_SECRET_ACCESS_KEY"],
+                **minio_kwargs,
+            )
             buckets = client.list_buckets()
             elapsed_ms = (time.perf_counter() - start) * 1000.0
             bucket_count = len(buckets)
         except Exception as exc:
-            _set_test_status(f"🔴 Connection failed: {_truncate_middle(str(exc), 120)}", "Error.TLabel")
-            statusbar.config(text="Connection test failed.")
+            message = f"🔴 Connection failed: {_truncate_middle(str(exc), 120)}"
+            _ui_post(lambda: (
+                _set_test_status(message, "Error.TLabel"),
+                statusbar.config(text="Connection test failed."),
+            ))
         else:
             count_text = "no buckets" if bucket_count == 0 else f"{bucket_count} bucket{'s' if bucket_count != 1 else ''}"
-            _set_test_status(f"✅ Connected in {elapsed_ms:.0f} ms • {count_text}", "Success.TLabel")
-            statusbar.config(text="Connection test succeeded.")
+            message = f"✅ Connected in {elapsed_ms:.0f} ms • {count_text}"
+            _ui_post(lambda: (
+                _set_test_status(message, "Success.TLabel"),
+                statusbar.config(text="Connection test succeeded."),
+            ))
         finally:
-            s_btn_test.state(["!disabled"])
-            _validate_fields()
+            _ui_post(_finish_settings_test)
 
+    _settings_test["running"] = True
     _set_test_status("⏳ Testing connection…", "StatusInfo.TLabel")
     s_btn_test.state(["disabled"])
-    root.after(100, run_test)
+    # list_buckets blocks for up to the pool's 3 s connect + 6 s read timeouts.
+    threading.Thread(target=run_test, daemon=True).start()
 
 
 _apply_env_from_settings(_initial_settings or {})
 _refresh_configuration_status()
 s_btn_save.config(command=_on_settings_save)
 s_btn_test.config(command=_on_settings_test)
-cfg_custom_endpoint.trace_add("write", lambda *_: _on_endpoint_change())
-cfg_region.trace_add("write", lambda *_: _update_endpoint_field())
+for _cfg_var in (cfg_custom_endpoint, cfg_region, cfg_provider, cfg_endpoint,
+                 cfg_access_key, cfg_secret_key, cfg_path_style, cfg_secure):
+    _cfg_var.trace_add("write", _mark_settings_dirty)
+cfg_custom_endpoint.trace_add("write", lambda *_: _debounce(_on_endpoint_change, "endpoint"))
+cfg_region.trace_add("write", lambda *_: _debounce(_update_endpoint_field, "region"))
 cfg_provider.trace_add("write", lambda *_: _on_provider_change())
-cfg_endpoint.trace_add("write", lambda *_: _on_endpoint_change())
-cfg_access_key.trace_add("write", lambda *_: _validate_fields())
-cfg_secret_key.trace_add("write", lambda *_: _validate_fields())
-cfg_path_style.trace_add("write", lambda *_: _validate_fields())
-cfg_secure.trace_add("write", lambda *_: _validate_fields())
+cfg_endpoint.trace_add("write", lambda *_: _debounce(_on_endpoint_change, "endpoint"))
+cfg_access_key.trace_add("write", lambda *_: _debounce(_validate_fields, "validate"))
+cfg_secret_key.trace_add("write", lambda *_: _debounce(_validate_fields, "validate"))
+cfg_path_style.trace_add("write", lambda *_: _debounce(_validate_fields, "validate"))
+cfg_secure.trace_add("write", lambda *_: _debounce(_validate_fields, "validate"))
 _on_provider_change()
 _set_test_status("")
 _validate_fields()
@@ -3908,12 +4157,7 @@ s_info_path.bind("<Button-1>", _reveal_settings_file)
 s_info_path.bind("<Return>", _reveal_settings_file)
 
 # Ensure long status messages wrap instead of stretching the window
-def _update_progress_wrap():
-    try:
-        wrap = max(320, root.winfo_width() - 360)
-    except Exception:
-        wrap = 320
-    for lbl in (up_status, dl_status, up_meta_label, dl_meta_label, ls_summary,
+_WRAP_LABELS = (up_status, dl_status, up_meta_label, dl_meta_label, ls_summary,
                 u_callout_text, u_form_hint, u_status_hint,
                 d_callout_text, d_form_hint, d_status_hint,
                 l_callout_text, l_form_hint, l_results_hint,
@@ -3924,13 +4168,31 @@ def _update_progress_wrap():
                 db_callout_text, db_form_hint, db_status_hint,
                 s_callout_text, s_form_hint, s_region_hint, s_endpoint_hint,
                 s_access_hint, s_secret_hint,
-                s_info_hint, s_info_message, s_info_path):
+                s_info_hint, s_info_message, s_info_path)
+_last_root_width = [None]
+
+def _update_progress_wrap(force=False):
+    try:
+        root_w = root.winfo_width()
+    except Exception:
+        root_w = None
+    if not force and root_w is not None and root_w == _last_root_width[0]:
+        return
+    _last_root_width[0] = root_w
+    wrap = max(320, root_w - 360) if root_w is not None else 320
+    # Several labels share a parent (metrics rows, section bodies); measure
+    # each parent once per pass instead of twice per label.
+    parent_widths = {}
+    for lbl in _WRAP_LABELS:
         try:
             parent_width = 0
             try:
                 parent = lbl.master
                 if parent is not None:
-                    parent_width = max(parent.winfo_width(), parent.winfo_reqwidth())
+                    parent_width = parent_widths.get(parent)
+                    if parent_width is None:
+                        parent_width = max(parent.winfo_width(), parent.winfo_reqwidth())
+                        parent_widths[parent] = parent_width
             except Exception:
                 parent_width = 0
             effective = parent_width if parent_width and parent_width > 0 else wrap
@@ -3938,17 +4200,28 @@ def _update_progress_wrap():
                 candidate = effective - 40
             else:
                 candidate = effective
-            lbl.configure(wraplength=max(100, min(wrap, candidate)))
+            value = max(100, min(wrap, candidate))
+            if getattr(lbl, "_last_wrap", None) != value:
+                lbl.configure(wraplength=value)
+                lbl._last_wrap = value
         except Exception:
             pass
 
 _update_progress_wrap()
 
 # Switch between compact and wide based on window width
-def on_resize(event):
+def on_resize(event=None):
     try:
         w = root.winfo_width()
         compact = (w < 820)  # breakpoint
+        settings_compact = (w < 960)
+        flipped = (_layout_state["compact"] != compact
+                   or _layout_state["settings_compact"] != settings_compact)
+        last_w = _layout_state.get("last_width")
+        # Small drags that cross no breakpoint don't need relayout or rewrap.
+        if not flipped and last_w is not None and abs(w - last_w) < 8:
+            return
+        _layout_state["last_width"] = w
         if _layout_state["compact"] != compact:
             _layout_state["compact"] = compact
             layout_upload(compact)
@@ -3956,34 +4229,47 @@ def on_resize(event):
             layout_list(compact)
             layout_delete_object(compact)
             layout_delete_bucket(compact)
-        settings_compact = (w < 960)
         if _layout_state["settings_compact"] != settings_compact:
             layout_settings_form(settings_compact)
         _update_progress_wrap()
     except Exception:
         pass
 
-root.bind("<Configure>", on_resize)
+# The toplevel bindtag also sees every child's <Configure>; only the window's
+# own size matters to on_resize, so skip the rest before touching the timer.
+root.bind("<Configure>", lambda e: _debounce(on_resize, "resize", 50) if e.widget is root else None)
 root.after(0, _update_progress_wrap)
+# Hidden tabs report stale parent widths; re-measure once a tab is shown.
+notebook.bind("<<NotebookTabChanged>>", lambda e: _debounce(lambda: _update_progress_wrap(force=True), "wrap_tab", 50), add="+")
 
 # Ensure persisted credentials exist before performing S3 actions.
-def _require_saved_credentials(action_text: str) -> bool:
-    settings = load_s3_settings()
+# Result of the saved-credentials check for one persisted-settings dict and
+# resolved provider; only recomputed when either changes. The provider falls
+# back to the live Settings choice when the file doesn't record one.
+_creds_state = {"source": None, "ok": False, "missing": [], "provider": PROVIDER_AWS}
+
+def _creds_provider(settings):
     provider = settings.get("PROVIDER", cfg_provider.get() or PROVIDER_AWS)
     if provider not in (PROVIDER_AWS, PROVIDER_MINIO):
         provider = PROVIDER_AWS
-    required = [
-        ("Access Key ID", "AWS_ACCESS_KEY_ID"),
-        ("Secret Access Key", "AWS_SECRET_ACCESS_KEY"),
-    ]
-    if provider == PROVIDER_AWS:
-        required.insert(0, ("AWS Region", "AWS_REGION"))
-    else:
-        required.append(("Endpoint", "AWS_S3_ENDPOINT"))
+    return provider
 
+def _refresh_creds_state(settings, provider=None):
+    if provider is None:
+        provider = _creds_provider(settings)
+    is_aws = provider == PROVIDER_AWS
+    required = _REQUIRED_FIELDS[(is_aws, not is_aws)]
     missing = [label for label, key in required if not str(settings.get(key, "")).strip()]
-    if missing:
-        provider_name = _provider_display_name(provider)
+    _creds_state.update(source=settings, ok=not missing, missing=missing, provider=provider)
+
+def _require_saved_credentials(action_text: str) -> bool:
+    settings = _load_s3_settings_cached()
+    provider = _creds_provider(settings)
+    if _creds_state["source"] is not settings or _creds_state["provider"] != provider:
+        _refresh_creds_state(settings, provider)
+    if not _creds_state["ok"]:
+        missing = _creds_state["missing"]
+        provider_name = _provider_display_name(_creds_state["provider"])
         missing_text = ", ".join(missing)
         message = (
             f"Cannot {action_text} because {provider_name} connection settings are incomplete or not saved.\n\n"
@@ -3999,6 +4285,53 @@ def _require_saved_credentials(action_text: str) -> bool:
         return False
     return True
 
+# Latest progress sample from a transfer worker. Workers overwrite the slot on
+# every chunk; a single 100 ms poller on the Tk thread consumes it, so the
+# event queue stays bounded no matter how fast the transfer runs.
+_upload_progress_slot = {"lock": threading.Lock(), "data": None, "push": None, "active": False, "after_id": None}
+_download_progress_slot = {"lock": threading.Lock(), "data": None, "push": None, "active": False, "after_id": None}
+
+def _progress_slot_start(slot):
+    with slot["lock"]:
+        slot["data"] = None
+        slot["push"] = None
+        slot["active"] = True
+    if slot["after_id"] is None:
+        slot["after_id"] = root.after(100, lambda: _drain_progress_slot(slot))
+
+def _progress_slot_put(slot, *sample):
+    with slot["lock"]:
+        slot["data"] = sample
+
+def _progress_slot_stop(slot):
+    """Stop polling and drop any unread sample (called from the worker)."""
+    with slot["lock"]:
+        slot["data"] = None
+        slot["active"] = False
+
+def _progress_slot_cancel(slot):
+    """Tk-thread stop: drop the pending sample and the scheduled poll."""
+    _progress_slot_stop(slot)
+    after_id, slot["after_id"] = slot["after_id"], None
+    if after_id is not None:
+        try:
+            root.after_cancel(after_id)
+        except Exception:
+            pass
+
+def _drain_progress_slot(slot):
+    slot["after_id"] = None
+    with slot["lock"]:
+        sample, slot["data"] = slot["data"], None
+        push, active = slot["push"], slot["active"]
+    if sample is not None and push is not None:
+        try:
+            push(*sample)
+        except Exception:
+            pass
+    if active:
+        slot["after_id"] = root.after(100, lambda: _drain_progress_slot(slot))
+
 # ---------------- Logic (same as before, but no extra_headers) ----------------
 def _maybe_autofill_upload_key_from_path(path):
     path = (path or "").strip()
@@ -4025,24 +4358,60 @@ def _maybe_enable_upload(*_):
     up_btn_start.config(state=("normal" if ok else "disabled"))
 
 
+# Last stat() of the upload source; edits to bucket/key reuse it instead of
+# hitting the filesystem again. Re-checked when a file is (re)picked and when
+# the window regains focus, since the file may have changed on disk meanwhile.
+_upload_file_stat_cache = {"path": None, "stamp": None, "size": None, "mtime": None,
+                           "exists": False, "mtime_text": None}
+
+def _upload_file_stat(path, refresh=False):
+    cache = _upload_file_stat_cache
+    if refresh or path != cache["path"]:
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
+        exists = bool(st is not None and S_ISREG(st.st_mode))
+        stamp = (path, st.st_mtime_ns, st.st_size) if exists else (path, None, None)
+        cache["path"] = path
+        if stamp != cache["stamp"]:
+            mtime = st.st_mtime if exists else None
+            cache.update(stamp=stamp, exists=exists,
+                         size=(st.st_size if exists else None),
+                         mtime=mtime,
+                         # Formatted with the stat so keystrokes reuse it.
+                         mtime_text=(time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
+                                     if exists else None))
+    return cache
+
+def _recheck_upload_file():
+    cache = _upload_file_stat_cache
+    path = up_file.get().strip()
+    before = cache["stamp"]
+    _upload_file_stat(path, refresh=True)
+    if cache["stamp"] != before:
+        _update_upload_summary()
+
+
 def _update_upload_summary(*_):
     path = up_file.get().strip()
     bucket = up_bucket.get().strip()
     key = up_key.get().strip()
+    fstat = _upload_file_stat(path)
 
-    if path and os.path.isfile(path):
-        size = os.path.getsize(path)
+    if path and fstat["exists"]:
+        size = fstat["size"]
         base = os.path.basename(path) or path
-        mtime = time.strftime("%Y-%m-%d %H:%M", time.localtime(os.path.getmtime(path)))
-        up_metric_file.config(text=f"📄 File: {human_size(size)} • {_truncate_middle(base, 40)}")
-        up_metric_meta.config(text=f"🕒 Modified: {mtime}")
+        mtime = fstat["mtime_text"]
+        _set_label_text(up_metric_file, f"📄 File: {human_size(size)} • {_truncate_middle(base, 40)}")
+        _set_label_text(up_metric_meta, f"🕒 Modified: {mtime}")
     elif path:
         base = os.path.basename(path) or path
-        up_metric_file.config(text=f"📄 File: {_truncate_middle(base, 40)}")
-        up_metric_meta.config(text="🕒 Modified: —")
+        _set_label_text(up_metric_file, f"📄 File: {_truncate_middle(base, 40)}")
+        _set_label_text(up_metric_meta, "🕒 Modified: —")
     else:
-        up_metric_file.config(text="📄 File: —")
-        up_metric_meta.config(text="🕒 Modified: —")
+        _set_label_text(up_metric_file, "📄 File: —")
+        _set_label_text(up_metric_meta, "🕒 Modified: —")
 
     if bucket:
         if key:
@@ -4054,26 +4423,29 @@ def _update_upload_summary(*_):
         dest_display = f"{bucket}/{dest_key}"
         if up_create.get():
             dest_display += " (auto-create)"
-        up_metric_dest.config(text=f"🎯 Destination: {_truncate_middle(dest_display, 60)}")
+        _set_label_text(up_metric_dest, f"🎯 Destination: {_truncate_middle(dest_display, 60)}")
     else:
-        up_metric_dest.config(text="🎯 Destination: —")
+        _set_label_text(up_metric_dest, "🎯 Destination: —")
 
     if str(up_btn_cancel.cget("state")).lower() == "disabled":
-        if path and os.path.isfile(path):
-            size = os.path.getsize(path)
-            note = f"🚀 Ready • {human_size(size)} file"
+        if path and fstat["exists"]:
+            note = f"🚀 Ready • {human_size(fstat['size'])} file"
             if bucket:
                 note += f" to {bucket}"
             else:
                 note += " (set bucket)"
         else:
             note = "No upload in progress."
-        up_meta_label.config(text=note)
+        _set_label_text(up_meta_label, note)
+
+# Focus changes are rare next to keystrokes; one stat each catches a source
+# file edited in another app while this window was in the background.
+root.bind("<FocusIn>", lambda e: _debounce(_recheck_upload_file, "upload_recheck", 100), add="+")
 
 def _on_upload_field_change(*_):
     _maybe_autofill_upload_key_from_path(up_file.get())
     _maybe_enable_upload()
-    _update_upload_summary()
+    _debounce(_update_upload_summary, "upload_summary")
 
 
 def _on_upload_key_var_change(*_):
@@ -4107,13 +4479,13 @@ def _update_download_summary(*_):
             obj_text = key
     else:
         obj_text = "(set object key)"
-    dl_metric_object.config(text=f"🗂️ Object: {_truncate_middle(obj_text, 60)}")
+    _set_label_text(dl_metric_object, f"🗂️ Object: {_truncate_middle(obj_text, 60)}")
 
     if dest:
         expanded = os.path.expanduser(dest)
-        dl_metric_dest.config(text=f"💾 Save to: {_truncate_middle(expanded, 60)}")
+        _set_label_text(dl_metric_dest, f"💾 Save to: {_truncate_middle(expanded, 60)}")
     else:
-        dl_metric_dest.config(text="💾 Save to: —")
+        _set_label_text(dl_metric_dest, "💾 Save to: —")
 
     if str(dl_btn_cancel.cget("state")).lower() == "disabled":
         parts = ["Ready"]
@@ -4123,15 +4495,55 @@ def _update_download_summary(*_):
             parts.append("set key")
         if not dest:
             parts.append("set destination")
-        dl_metric_meta.config(text="📶 Status: " + " • ".join(parts))
+        _set_label_text(dl_metric_meta, "📶 Status: " + " • ".join(parts))
 
-dl_bucket.trace_add("write", _update_download_summary)
-dl_key.trace_add("write", _update_download_summary)
-dl_out.trace_add("write", _update_download_summary)
+dl_bucket.trace_add("write", lambda *_: _debounce(_update_download_summary, "download_summary"))
+dl_key.trace_add("write", lambda *_: _debounce(_update_download_summary, "download_summary"))
+dl_out.trace_add("write", lambda *_: _debounce(_update_download_summary, "download_summary"))
 _update_download_summary()
 
 
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+UPLOAD_LARGE_PART_SIZE = 16 * 1024 * 1024
+S3_MAX_PARTS = 10000
+
+def _upload_plan(total):
+    """Return (part_size, parallel_parts) for an upload of `total` bytes."""
+    if total > 64 * 1024 * 1024:
+        part_size, parallel = UPLOAD_LARGE_PART_SIZE, 8
+    elif total > 32 * 1024 * 1024:
+        part_size, parallel = UPLOAD_PART_SIZE, 4
+    else:
+        part_size, parallel = UPLOAD_PART_SIZE, 1
+    # Stay under the 10,000-part limit on very large files (whole MiB parts).
+    min_part = -(-total // S3_MAX_PARTS)
+    if min_part > part_size:
+        part_size = -(-min_part // (1024 * 1024)) * 1024 * 1024
+    return part_size, parallel
+
+class _SentBytesHttp:
+    """Wrap the urllib3 pool for one upload client and report each PUT body
+    once its request has returned. The SDK reads parts ahead of the parallel
+    uploads, so counting on read runs up to (parallel + 1) parts early."""
+
+    def __init__(self, http, on_sent):
+        self._http = http
+        self._on_sent = on_sent
+
+    def urlopen(self, method, url, body=None, **kwargs):
+        resp = self._http.urlopen(method, url, body=body, **kwargs)
+        if method == "PUT" and body and 200 <= resp.status < 300:
+            try:
+                self._on_sent(len(body))
+            except Exception:
+                pass
+        return resp
+
+    def __getattr__(self, name):
+        return getattr(self._http, name)
+
 def upload_start():
+    _debounce_flush()
     bucket = up_bucket.get().lower().strip()
     key = (up_key.get().strip() or os.path.basename(up_file.get()))
     path = up_file.get().strip()
@@ -4166,24 +4578,52 @@ def upload_start():
         return
 
     up_progress["value"] = 0
+    up_progress._last_value = 0
     up_progress["maximum"] = total
+    up_progress._cur_max = total
+    up_status_text._last_bar_update = 0.0
     source_name = os.path.basename(path) or os.path.basename(key) or path
     display_name = f"{source_name} → {bucket}/{key}"
     context = {"display": display_name, "start": time.time()}
     _update_transfer_meta(up_meta_label, "Upload", context["display"], 0, total, 0.0, 0.0, note="Preparing…")
+    _progress_slot_start(_upload_progress_slot)
 
     def worker():
         context["start"] = time.time()
         result_note = "Completed"
+        sent_lock = threading.Lock()
+        count_on_send = False
+        uploading = False
+
+        def on_part_sent(n):
+            nonlocal seen, last_fmt
+            # Bucket creation also PUTs a body; only object data counts.
+            if not uploading:
+                return
+            with sent_lock:
+                seen += n
+                now = time.time()
+                elapsed_total = max(now - t0, 1e-3)
+                if now - last_fmt >= 0.1:
+                    last_fmt = now
+                    format_update(seen, seen / elapsed_total, elapsed_total)
+
+        def wrap_http(http):
+            nonlocal count_on_send
+            count_on_send = True
+            return _SentBytesHttp(http, on_part_sent)
+
         try:
-            client = get_client()
+            _load_minio()
+            client = get_client(wrap_http=wrap_http)
         except Exception as e:
+            _progress_slot_stop(_upload_progress_slot)
             result_note = f"Client error: {e}"
             elapsed_fail = max(time.time() - context["start"], 1e-3)
             note_text = _truncate_middle(result_note, 64)
-            root.after(0, lambda elapsed=elapsed_fail, note=note_text:
-                       _update_transfer_meta(up_meta_label, "Upload", context["display"], 0, total, 0.0, elapsed, note))
-            return root.after(0, lambda e=e: (
+            _ui_post(lambda elapsed=elapsed_fail, note=note_text:
+                   _update_transfer_meta(up_meta_label, "Upload", context["display"], 0, total, 0.0, elapsed, note))
+            return _ui_post(lambda e=e: (
                 _update_textbox(up_status_text, f"Client error: {e}"),
                 _rearm(up_btn_start, up_btn_cancel)
             ))
@@ -4191,23 +4631,23 @@ def upload_start():
         # Optionally create bucket
         if up_create.get():
             try:
-                root.after(0, lambda: _update_textbox(up_status_text, "Checking or creating bucket…"))
+                _ui_post(lambda: _update_textbox(up_status_text, "Checking or creating bucket…"))
                 if not client.bucket_exists(bucket):
-                    region = os.environ.get("AWS_REGION")
-                    client.make_bucket(bucket, location=(region if region != "us-east-1" else None))
+                    client.make_bucket(bucket, location=(captured_region if captured_region != "us-east-1" else None))
             except Exception as e:
+                _progress_slot_stop(_upload_progress_slot)
                 result_note = f"Bucket error: {e}"
                 elapsed_fail = max(time.time() - context["start"], 1e-3)
                 note_text = _truncate_middle(result_note, 64)
-                root.after(0, lambda elapsed=elapsed_fail, note=note_text:
-                           _update_transfer_meta(up_meta_label, "Upload", context["display"], 0, total, 0.0, elapsed, note))
-                return root.after(0, lambda e=e: (
+                _ui_post(lambda elapsed=elapsed_fail, note=note_text:
+                       _update_transfer_meta(up_meta_label, "Upload", context["display"], 0, total, 0.0, elapsed, note))
+                return _ui_post(lambda e=e: (
                     _update_textbox(up_status_text, f"Bucket error: {e}"),
                     _rearm(up_btn_start, up_btn_cancel)
                 ))
         seen = 0
+        read_bytes = 0
         t0 = context["start"]
-        last_time = t0
 
         def push_update(transferred, avg_speed, elapsed_total):
             _update_transfer_meta(
@@ -4220,30 +4660,44 @@ def upload_start():
                 elapsed_total,
                 note=None,
             )
-            _update_bar(up_progress, up_status_text, total, transferred)
+            _update_bar(up_progress, up_status_text, total, transferred, metrics=context)
+
+        def apply_update(transferred, meta_text, line_text, footer_text):
+            _set_label_text(up_meta_label, meta_text)
+            _apply_bar(up_progress, up_status_text, total, transferred, line_text, footer_text)
+
+        def format_update(transferred, avg_speed, elapsed_total):
+            # Runs on the worker; the Tk poller only applies the strings.
+            meta_text = _format_transfer_meta("Upload", context["display"], transferred, total, avg_speed, elapsed_total)
+            line_text, footer_text = _format_bar(context, total, transferred)
+            _progress_slot_put(_upload_progress_slot, transferred, meta_text, line_text, footer_text)
+
+        _upload_progress_slot["push"] = apply_update
+        last_fmt = 0.0
+
+        part_size, parallel_parts = _upload_plan(total)
 
         class ProgressFile:
             def __init__(self, p):
-                self.f = open(p, "rb")
+                # Unbuffered: the SDK asks for whole parts, so each read() is one
+                # syscall straight into the returned bytes with no extra copy.
+                self.f = open(p, "rb", buffering=0)
                 self.cancelled = False
             def read(self, n):
-                nonlocal seen
-                nonlocal last_time
+                nonlocal read_bytes
                 if cancel_event.is_set():
                     self.cancelled = True
                     raise UploadCancelled("Upload cancelled by user")
-                requested = 512 * 1024 if n is None else min(max(n, 1), 512 * 1024)
+                # One read per part: the SDK then uses the returned bytes as the
+                # request body as-is instead of concatenating smaller slices.
+                requested = part_size if (n is None or n < 0) else min(max(n, 1), part_size)
                 chunk = self.f.read(requested)
                 if chunk:
-                    seen += len(chunk)
-                    now = time.time()
-                    dt = max(now - last_time, 1e-3)
-                    last_time = now
-                    spd = len(chunk) / dt
-                    elapsed_total = max(now - t0, 1e-3)
-                    avg_speed = seen / elapsed_total if elapsed_total > 0 else 0.0
-                    root.after(0, lambda s=seen, avg=avg_speed, elapsed=elapsed_total:
-                               push_update(s, avg, elapsed))
+                    read_bytes += len(chunk)
+                    # Progress normally advances per completed PUT (on_part_sent);
+                    # without the shared pool to wrap, fall back to counting reads.
+                    if not count_on_send:
+                        on_part_sent(len(chunk))
                 return chunk
             def __getattr__(self, n): return getattr(self.f, n)
             def close(self): self.f.close()
@@ -4251,34 +4705,56 @@ def upload_start():
         fp = None
         try:
             fp = ProgressFile(path)
-            root.after(0, lambda: _update_textbox(up_status_text, "Uploading…"))
-            client.put_object(
+            uploading = True
+            _ui_post(lambda: _update_textbox(up_status_text, "Uploading…"))
+            put_kwargs = dict(
                 bucket_name=bucket,
                 object_name=key,
                 data=fp,
                 length=total,
-                part_size=8 * 1024 * 1024,
+                part_size=part_size,
             )
+            # Large files: several parts in flight on separate connections. The
+            # SDK reads parts in order and blocks once every worker is busy, so
+            # memory stays at about (parallel + 1) parts.
+            if parallel_parts > 1:
+                put_kwargs["num_parallel_uploads"] = parallel_parts
+            try:
+                try:
+                    client.put_object(**put_kwargs)
+                except TypeError:
+                    if "num_parallel_uploads" not in put_kwargs or read_bytes:
+                        raise
+                    # SDKs without parallel part uploads.
+                    put_kwargs.pop("num_parallel_uploads")
+                    client.put_object(**put_kwargs)
+            finally:
+                _progress_slot_stop(_upload_progress_slot)
+            # Flush the last throttled progress sample before the result message.
+            elapsed_done = max(time.time() - t0, 1e-3)
+            _ui_post(lambda s=seen, avg=seen / elapsed_done, elapsed=elapsed_done:
+                   push_update(s, avg, elapsed))
             if cancel_event.is_set() or getattr(fp, "cancelled", False):
                 result_note = "Cancelled"
-                root.after(0, lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
+                _ui_post(lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
             else:
-                root.after(0, lambda: _update_textbox(up_status_text, f"✅ Upload complete: {key}"))
+                _ui_post(lambda: _update_textbox(up_status_text, f"✅ Upload complete: {key}"))
         except UploadCancelled:
             result_note = "Cancelled"
-            root.after(0, lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
+            _ui_post(lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
         except S3Error as e:
             result_note = f"S3 error: {e}"
-            root.after(0, lambda e=e: _update_textbox(up_status_text, f"S3 error: {e}"))
+            _ui_post(lambda e=e: _update_textbox(up_status_text, f"S3 error: {e}"))
         except Exception as e:
             lowered = str(e).lower()
             if cancel_event.is_set() or "not enough data" in lowered:
                 result_note = "Cancelled"
-                root.after(0, lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
+                _ui_post(lambda: _update_textbox(up_status_text, "⚠️ Upload cancelled"))
             else:
                 result_note = f"Unexpected error: {e}"
-                root.after(0, lambda e=e: _update_textbox(up_status_text, f"Unexpected error: {e}"))
+                _ui_post(lambda e=e: _update_textbox(up_status_text, f"Unexpected error: {e}"))
         finally:
+            _progress_slot_stop(_upload_progress_slot)
             try:
                 if fp is not None:
                     fp.close()
@@ -4287,21 +4763,24 @@ def upload_start():
             elapsed_final = max(time.time() - context["start"], 1e-3)
             avg_final = (seen / elapsed_final) if elapsed_final > 0 else 0.0
             note_text = _truncate_middle(result_note, 64) if result_note else None
-            root.after(0, lambda s=seen, avg=avg_final, elapsed=elapsed_final, note=note_text:
-                       _update_transfer_meta(up_meta_label, "Upload", context["display"], s, total, avg, elapsed, note))
-            root.after(0, lambda: _rearm(up_btn_start, up_btn_cancel))
+            _ui_post(lambda s=seen, avg=avg_final, elapsed=elapsed_final, note=note_text:
+                   _update_transfer_meta(up_meta_label, "Upload", context["display"], s, total, avg, elapsed, note))
+            _ui_post(lambda: _rearm(up_btn_start, up_btn_cancel))
 
+    # Snapshot on the Tk thread so a settings save mid-upload can't race the worker.
+    captured_region = os.environ.get("AWS_REGION")
     threading.Thread(target=worker, daemon=True).start()
 
 def upload_cancel():
     cancel_event.set()
+    _progress_slot_cancel(_upload_progress_slot)
     global _upload_busy
     _upload_busy = False
     _refresh_upload_button(reschedule=False)
     _reset_progress_metrics(up_status)
     up_status.config(text="Cancelling…")
     statusbar.config(text="Cancelling…")
-    up_meta_label.config(text="Cancelling upload…")
+    _set_label_text(up_meta_label, "Cancelling upload…")
 
 up_btn_start.config(command=upload_start)
 up_btn_cancel.config(command=upload_cancel)
@@ -4309,6 +4788,7 @@ up_btn_cancel.config(command=upload_cancel)
 _refresh_upload_button(reschedule=True)
 
 def download_start():
+    _debounce_flush()
     bucket = dl_bucket.get().lower().strip()
     key = dl_key.get().strip()
     outp = dl_out.get().strip()
@@ -4329,26 +4809,34 @@ def download_start():
     cancel_event.clear()
     dl_btn_start.config(state="disabled")
     dl_btn_cancel.config(state="normal")
+    # The worker sets the new maximum once it knows the size; until then the
+    # bar must not keep showing the previous transfer's value.
+    dl_progress.configure(value=0)
+    dl_progress._last_value = 0
+    dl_status_text._last_bar_update = 0.0
     _update_textbox(dl_status_text, "Starting download…")
     _reset_progress_metrics(dl_status, reset_footer=True)
     statusbar.config(text=f"Downloading {key}…")
     _update_download_summary()
-    dl_metric_meta.config(text="📶 Status: Starting…")
+    _set_label_text(dl_metric_meta, "📶 Status: Starting…")
     context = {"display": f"{bucket}/{key}", "start": time.time(), "total": None}
     _update_transfer_meta(dl_meta_label, "Download", context["display"], 0, 0, 0.0, 0.0, note="Preparing…")
+    _progress_slot_start(_download_progress_slot)
 
     def worker():
         context["start"] = time.time()
         result_note = "Completed"
         try:
+            _load_minio()
             client = get_client()
         except Exception as e:
+            _progress_slot_stop(_download_progress_slot)
             result_note = f"Client error: {e}"
             elapsed_fail = max(time.time() - context["start"], 1e-3)
             note_text = _truncate_middle(result_note, 64)
-            root.after(0, lambda elapsed=elapsed_fail, note=note_text:
-                       _update_transfer_meta(dl_meta_label, "Download", context["display"], 0, context.get("total"), 0.0, elapsed, note))
-            return root.after(0, lambda e=e: (
+            _ui_post(lambda elapsed=elapsed_fail, note=note_text:
+                   _update_transfer_meta(dl_meta_label, "Download", context["display"], 0, context.get("total"), 0.0, elapsed, note))
+            return _ui_post(lambda e=e: (
                 _update_textbox(dl_status_text, f"Client error: {e}"),
                 _rearm(dl_btn_start, dl_btn_cancel)
             ))
@@ -4373,7 +4861,20 @@ def download_start():
                 out_file = str(p)
 
         context["display"] = f"{bucket}/{key} → {out_file}"
-        root.after(0, lambda: _update_transfer_meta(
+        # Arm the bar before any text for this transfer is written, so no frame
+        # pairs the previous transfer's value or throttle stamp with the new total.
+        if total:
+            def arm_bar(total=total):
+                dl_progress.configure(maximum=total, value=0)
+                dl_progress._cur_max = total
+                dl_progress._last_value = 0
+                dl_status_text._last_bar_update = 0.0
+                dl_status_text._last_seen = -1
+            _ui_post(arm_bar)
+        else:
+            # Unknown size: Tk animates the bar itself, no per-chunk updates.
+            _ui_post(lambda: (dl_progress.configure(mode="indeterminate"), dl_progress.start(50)))
+        _ui_post(lambda: _update_transfer_meta(
             dl_meta_label,
             "Download",
             context["display"],
@@ -4384,12 +4885,6 @@ def download_start():
             note="Preparing…",
         ))
 
-        if total:
-            dl_progress["maximum"] = total
-        else:
-            dl_progress["mode"] = "indeterminate"
-            root.after(0, dl_progress.start)
-
         seen = 0
         last_time = context["start"]
 
@@ -4404,181 +4899,593 @@ def download_start():
                 elapsed_total,
                 note=None,
             )
-            _update_bar(dl_progress, dl_status_text, context.get("total"), transferred)
+            _update_bar(dl_progress, dl_status_text, context.get("total"), transferred, metrics=context)
+
+        def apply_update(transferred, meta_text, line_text, footer_text):
+            _set_label_text(dl_meta_label, meta_text)
+            _apply_bar(dl_progress, dl_status_text, context.get("total"), transferred, line_text, footer_text)
+
+        def format_update(transferred, avg_speed, elapsed_total):
+            # Runs on the worker; the Tk poller only applies the strings.
+            meta_text = _format_transfer_meta("Download", context["display"], transferred, context.get("total"), avg_speed, elapsed_total)
+            line_text, footer_text = _format_bar(context, context.get("total"), transferred)
+            _progress_slot_put(_download_progress_slot, transferred, meta_text, line_text, footer_text)
+
+        _download_progress_slot["push"] = apply_update
+        last_fmt = 0.0
 
         try:
             resp = client.get_object(bucket, key)
-            with open(out_file, "wb") as f:
-                while True:
-                    if cancel_event.is_set():
-                        break
-                    chunk = resp.read(32 * 1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    seen += len(chunk)
-                    now = time.time()
-                    dt_chunk = max(now - last_time, 1e-3)
-                    last_time = now
-                    elapsed_total = max(now - context["start"], 1e-3)
-                    avg_speed = seen / elapsed_total if elapsed_total > 0 else 0.0
-                    root.after(0, lambda s=seen, avg=avg_speed, elapsed=elapsed_total:
-                               push_update(s, avg, elapsed))
+            try:
+                with open(out_file, "wb") as f:
+                    while True:
+                        if cancel_event.is_set():
+                            break
+                        chunk = resp.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        seen += len(chunk)
+                        now = time.time()
+                        dt_chunk = max(now - last_time, 1e-3)
+                        last_time = now
+                        elapsed_total = max(now - context["start"], 1e-3)
+                        avg_speed = seen / elapsed_total if elapsed_total > 0 else 0.0
+                        if now - last_fmt >= 0.1:
+                            last_fmt = now
+                            format_update(seen, avg_speed, elapsed_total)
+            finally:
+                _progress_slot_stop(_download_progress_slot)
+            # Flush the last throttled progress sample before the result message.
+            elapsed_done = max(time.time() - context["start"], 1e-3)
+            _ui_post(lambda s=seen, avg=seen / elapsed_done, elapsed=elapsed_done:
+                   push_update(s, avg, elapsed))
             resp.close(); resp.release_conn()
             if cancel_event.is_set():
                 result_note = "Cancelled"
-                root.after(0, lambda: _update_textbox(dl_status_text, "⚠️ Download cancelled"))
+                _ui_post(lambda: _update_textbox(dl_status_text, "⚠️ Download cancelled"))
             else:
-                root.after(0, lambda: _update_textbox(dl_status_text, f"✅ Downloaded to: {out_file}"))
+                _ui_post(lambda: _update_textbox(dl_status_text, f"✅ Downloaded to: {out_file}"))
         except S3Error as e:
             result_note = f"S3 error: {e}"
-            root.after(0, lambda e=e: _update_textbox(dl_status_text, f"S3 error: {e}"))
+            _ui_post(lambda e=e: _update_textbox(dl_status_text, f"S3 error: {e}"))
         except Exception as e:
             if cancel_event.is_set():
                 result_note = "Cancelled"
-                root.after(0, lambda: _update_textbox(dl_status_text, "⚠️ Download cancelled"))
+                _ui_post(lambda: _update_textbox(dl_status_text, "⚠️ Download cancelled"))
             else:
                 result_note = f"Unexpected error: {e}"
-                root.after(0, lambda e=e: _update_textbox(dl_status_text, f"Unexpected error: {e}"))
+                _ui_post(lambda e=e: _update_textbox(dl_status_text, f"Unexpected error: {e}"))
         finally:
-            root.after(0, lambda: _rearm(dl_btn_start, dl_btn_cancel))
+            _progress_slot_stop(_download_progress_slot)
+            _ui_post(lambda: _rearm(dl_btn_start, dl_btn_cancel))
             if not total:
-                root.after(0, dl_progress.stop)
-                dl_progress["mode"] = "determinate"
-                dl_progress["value"] = 0
+                _ui_post(lambda: (dl_progress.stop(), dl_progress.configure(mode="determinate", value=0)))
             elapsed_final = max(time.time() - context["start"], 1e-3)
             avg_final = (seen / elapsed_final) if elapsed_final > 0 else 0.0
             note_text = _truncate_middle(result_note, 64) if result_note else None
-            root.after(0, lambda s=seen, avg=avg_final, elapsed=elapsed_final, note=note_text:
-                       _update_transfer_meta(dl_meta_label, "Download", context["display"], s, context.get("total"), avg, elapsed, note))
+            _ui_post(lambda s=seen, avg=avg_final, elapsed=elapsed_final, note=note_text:
+                   _update_transfer_meta(dl_meta_label, "Download", context["display"], s, context.get("total"), avg, elapsed, note))
 
     threading.Thread(target=worker, daemon=True).start()
 
 dl_btn_start.config(command=download_start)
 def download_cancel():
     cancel_event.set()
+    _progress_slot_cancel(_download_progress_slot)
     _reset_progress_metrics(dl_status)
     dl_status.config(text="Cancelling…")
     statusbar.config(text="Cancelling…")
-    dl_metric_meta.config(text="📶 Status: Cancelling…")
+    _set_label_text(dl_metric_meta, "📶 Status: Cancelling…")
     _update_download_summary()
 
 dl_btn_cancel.config(command=download_cancel)
 
-def do_list():
-    bucket = ls_bucket.get().lower().strip()
-    prefix = ls_prefix.get().strip() or None
+# Worker threads hand UI work to one Tk timer instead of queuing a 0 ms
+# after() callback per update; each tick applies what it can in ~15 ms. The
+# timer is armed by the first post and stops once both queues are empty, so
+# an idle window doesn't wake up.
+_ui_queue = queue.SimpleQueue()
+# Progress-style updates where only the newest matters, keyed by target;
+# applied before the ordered queue so a final message always lands last.
+_ui_latest = {}
+_ui_latest_lock = threading.Lock()
+_ui_tick_armed = False
+
+def _ui_arm():
+    global _ui_tick_armed
+    with _ui_latest_lock:
+        if _ui_tick_armed:
+            return
+        _ui_tick_armed = True
+    try:
+        root.after(33, _ui_tick)
+    except Exception:
+        # Window already gone; nothing left to update.
+        with _ui_latest_lock:
+            _ui_tick_armed = False
+
+def _ui_post(fn, *args):
+    _ui_queue.put((fn, args))
+    _ui_arm()
+
+def _ui_post_latest(key, fn, *args):
+    with _ui_latest_lock:
+        _ui_latest[key] = (fn, args)
+    _ui_arm()
+
+def _ui_tick():
+    global _ui_tick_armed
+    if _ui_latest:
+        with _ui_latest_lock:
+            latest = list(_ui_latest.values())
+            _ui_latest.clear()
+        for fn, args in latest:
+            try:
+                fn(*args)
+            except Exception:
+                root.report_callback_exception(*sys.exc_info())
+    deadline = time.monotonic() + 0.015
+    while time.monotonic() < deadline:
+        try:
+            fn, args = _ui_queue.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            fn(*args)
+        except Exception:
+            # Same reporting a failing root.after callback would get.
+            root.report_callback_exception(*sys.exc_info())
+    # Checked under the lock a poster takes to arm, so a post racing this
+    # check either lands in the queues or re-arms the timer itself.
+    with _ui_latest_lock:
+        if not _ui_latest and _ui_queue.empty():
+            _ui_tick_armed = False
+            return
+    root.after(33, _ui_tick)
+
+# Virtualised list view: every result row lives in _ls_view["rows"] and only
+# the slice in the viewport (plus overscan) exists as Treeview items. The
+# vertical scrollbar and mouse wheel move _ls_view["top"] over the row list.
+# Rows are (size_bytes, name) from the worker or (size_text, name, tag) for
+# status rows.
+_LS_OVERSCAN = 20
+# The selection is kept as absolute row indices so it survives the slice being
+# refilled; "shown" is the in-slice selection the last render applied.
+_ls_view = {"rows": [], "top": 0, "rendered": (0, 0), "row_h": 0, "body_y": 0,
+            "selected": set(), "focus": None, "shown": (), "rendering": False}
+
+def _ls_page_rows():
+    row_h = _ls_view["row_h"]
+    if not row_h:
+        try:
+            row_h = int(ttk.Style().lookup("List.Treeview", "rowheight") or 0)
+        except Exception:
+            row_h = 0
+        row_h = row_h or 20
+        _ls_view["row_h"] = row_h
+    height = ls_tree.winfo_height()
+    if height <= 1:
+        return int(ls_tree.cget("height") or 16)
+    # winfo_height includes the heading row and the border. body_y is the
+    # measured y of the first item row; until a row has been drawn assume a
+    # heading about one row tall. The bottom border gets the same allowance,
+    # so a partly visible last row is never counted as a full one.
+    body_y = _ls_view["body_y"] or row_h + 4
+    return max(1, (height - body_y - 4) // row_h)
+
+def _ls_render(force=False):
+    rows = _ls_view["rows"]
+    page = _ls_page_rows()
+    top = max(0, min(_ls_view["top"], len(rows) - page))
+    start = max(0, top - _LS_OVERSCAN)
+    end = min(len(rows), top + page + _LS_OVERSCAN)
+    _ls_view["top"] = top
+    if force or (start, end) != _ls_view["rendered"]:
+        _ls_view["rendering"] = True
+        try:
+            _ls_refill(rows, top, start, end)
+        finally:
+            _ls_view["rendering"] = False
+    n = len(rows)
+    if n <= page:
+        ls_output_scroll_y.set(0.0, 1.0)
+    else:
+        ls_output_scroll_y.set(top / n, min(1.0, (top + page) / n))
+
+def _ls_refill(rows, top, start, end):
+    # Detach the horizontal scrollbar while refilling so it is synced once,
+    # not after every delete/insert.
+    ls_tree.configure(xscrollcommand="")
+    children = ls_tree.get_children()
+    if children:
+        ls_tree.delete(*children)
+    # Raw Tcl insert: skips Treeview.insert's per-call option parsing.
+    call = ls_tree.tk.call
+    w = ls_tree._w
+    fmt = human_size
+    for i in range(start, end):
+        row = rows[i]
+        if len(row) == 2:
+            call(w, "insert", "", "end", "-id", i, "-values", (fmt(row[0]), row[1]))
+        else:
+            # Only status rows are tagged; a bare tag name is a one-item Tcl list.
+            call(w, "insert", "", "end", "-id", i, "-values", (row[0], row[1]), "-tags", row[2])
+    ls_tree.configure(xscrollcommand=ls_output_scroll_x.set)
+    ls_output_scroll_x.set(*ls_tree.xview())
+    keep = sorted(i for i in _ls_view["selected"] if start <= i < end)
+    if keep:
+        ls_tree.selection_set(keep)
+    focus = _ls_view["focus"]
+    if focus is not None and start <= focus < end:
+        ls_tree.focus(focus)
+    _ls_view["shown"] = ls_tree.selection()
+    ls_tree.yview_moveto(0)
+    if top > start:
+        ls_tree.yview_scroll(top - start, "units")
+    _ls_view["rendered"] = (start, end)
+    if not _ls_view["body_y"] and end > start:
+        try:
+            bbox = ls_tree.bbox(top)
+        except tk.TclError:
+            bbox = ""
+        if bbox:
+            _ls_view["body_y"] = bbox[1]
+
+def _ls_yview(*args):
+    if not args:
+        return
+    if args[0] == "moveto":
+        _ls_view["top"] = int(float(args[1]) * len(_ls_view["rows"]))
+    elif args[0] == "scroll":
+        step = int(args[1])
+        if str(args[2]).startswith("page"):
+            step *= _ls_page_rows()
+        _ls_view["top"] += step
+    else:
+        return
+    _ls_render()
+
+def _ls_on_wheel(event):
+    if getattr(event, "num", None) == 4:
+        step = -3
+    elif getattr(event, "num", None) == 5:
+        step = 3
+    else:
+        step = -3 if event.delta > 0 else 3
+    _ls_yview("scroll", step, "units")
+    return "break"
+
+def _ls_on_select(event=None):
+    # <<TreeviewSelect>> also fires (possibly queued) for the refill's own
+    # delete/selection_set; those leave the tree at the selection the render
+    # applied, so only a different selection came from the user.
+    if _ls_view["rendering"]:
+        return
+    current = ls_tree.selection()
+    if current == _ls_view["shown"]:
+        return
+    _ls_view["shown"] = current
+    _ls_view["selected"] = {int(iid) for iid in current}
+    iid = ls_tree.focus()
+    _ls_view["focus"] = int(iid) if iid else None
+    _ls_follow_focus()
+
+def _ls_follow_focus():
+    # Keyboard selection can step past the viewport; slide the window along.
+    idx = _ls_view["focus"]
+    if idx is None:
+        return
+    top, page = _ls_view["top"], _ls_page_rows()
+    if idx < top:
+        _ls_view["top"] = idx
+    elif idx >= top + page:
+        _ls_view["top"] = idx - page + 1
+    else:
+        return
+    _ls_render()
+
+def _ls_tree_scrolled(first, last):
+    # The tree scrolls itself for see() (keyboard focus) and drag-select
+    # autoscan; carry that offset back into _ls_view so the next render
+    # doesn't jump to the old position.
+    start, end = _ls_view["rendered"]
+    if end <= start:
+        return
+    top = start + int(round(float(first) * (end - start)))
+    if top != _ls_view["top"]:
+        _ls_view["top"] = top
+        _ls_render()
+
+def _ls_clear():
+    _ls_view["rows"] = []
+    _ls_view["top"] = 0
+    _ls_view["rendered"] = (0, 0)
+    _ls_view["selected"] = set()
+    _ls_view["focus"] = None
+    _ls_view["shown"] = ()
+    children = ls_tree.get_children()
+    if children:
+        ls_tree.delete(*children)
+    ls_output_scroll_y.set(0.0, 1.0)
+
+ls_output_scroll_y.config(command=_ls_yview)
+ls_tree.config(yscrollcommand=_ls_tree_scrolled)
+ls_tree.bind("<MouseWheel>", _ls_on_wheel)
+ls_tree.bind("<Button-4>", _ls_on_wheel)
+ls_tree.bind("<Button-5>", _ls_on_wheel)
+ls_tree.bind("<Configure>", lambda e: _ls_render(), add="+")
+ls_tree.bind("<<TreeviewSelect>>", _ls_on_select, add="+")
+
+def _insert_ls_rows(rows):
+    """Add (size_bytes, name) rows; only the visible slice becomes tree items."""
+    _ls_view["rows"].extend(rows)
+    _ls_render()
+
+# The list worker produces into a bounded queue (row batches, then result
+# dicts for _apply_ls_summary); a 50 ms Tk loop drains it within a small time
+# budget. A full queue blocks the worker, throttling the network side.
+def _drain_ls_queue(q):
+    deadline = time.monotonic() + 0.02
+    done = False
+    totals = None
+    for _ in range(8):
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(item, dict):
+            _apply_ls_summary(item)
+            done = done or bool(item.get("done"))
+            if "count" in item:
+                totals = None
+        else:
+            rows, count, size = item
+            _insert_ls_rows(rows)
+            totals = (count, size)
+        if done or time.monotonic() >= deadline:
+            break
+    # Running totals while the listing streams; the final summary overwrites them.
+    if totals is not None:
+        ls_metric_count.config(text=f"🧾 Objects: {totals[0]}…")
+        ls_metric_size.config(text=f"📦 Total size: {human_size(totals[1])}…")
+    if not done:
+        root.after(50, _drain_ls_queue, q)
+
+def _apply_ls_summary(state):
+    """Apply a list-worker result in one Tk callback. Keys are optional:
+    row=(values, tag), status, summary, count, size, done."""
+    row = state.get("row")
+    if row is not None:
+        _ls_view["rows"].append((row[0][0], row[0][1], row[1]))
+        _ls_render()
+    if "status" in state:
+        statusbar.config(text=state["status"])
+    if "summary" in state:
+        ls_summary.config(text=state["summary"])
+    if "count" in state:
+        ls_metric_count.config(text=state["count"])
+    if "size" in state:
+        ls_metric_size.config(text=state["size"])
+    if state.get("done"):
+        ls_btn.config(state="normal")
+        ls_btn_cancel.config(state="disabled")
+        ls_btn_more.config(state="normal" if _ls_page_state["start_after"] else "disabled")
+
+# Where the last capped listing stopped; "Load more" resumes from here with
+# start_after instead of re-walking the bucket.
+_ls_page_state = {"bucket": None, "prefix": None, "recursive": True,
+                  "start_after": None, "count": 0, "bytes": 0}
+
+def _ls_object_limit():
+    try:
+        return max(1, int(ls_load_limit.get()))
+    except (tk.TclError, ValueError):
+        return 10000
+
+def do_list(more=False):
+    page = _ls_page_state
+    if more and page["start_after"]:
+        bucket, prefix, recursive = page["bucket"], page["prefix"], page["recursive"]
+        start_after = page["start_after"]
+    else:
+        more = False
+        bucket = ls_bucket.get().lower().strip()
+        prefix = ls_prefix.get().strip() or None
+        recursive = ls_recursive.get()
+        start_after = None
     if not is_valid_bucket_name(bucket):
         messagebox.showerror("Invalid bucket", "Please enter a valid bucket name."); return
     if not _require_saved_credentials("list objects"):
         ls_summary.config(text="Cannot list objects without saved connection settings.")
         statusbar.config(text="Missing connection settings.")
         return
+    if not more:
+        page.update(bucket=bucket, prefix=prefix, recursive=recursive, count=0, bytes=0)
+    page["start_after"] = None
+    limit = _ls_object_limit()
+    ls_cancel_event.clear()
     ls_btn.config(state="disabled")
-    for item in ls_tree.get_children():
-        ls_tree.delete(item)
+    ls_btn_more.config(state="disabled")
+    ls_btn_cancel.config(state="normal")
+    if not more:
+        _ls_clear()
     statusbar.config(text="Listing objects…")
     ls_summary.config(text="Listing objects…")
     ls_metric_count.config(text="🧾 Objects: —")
     ls_metric_size.config(text="📦 Total size: —")
     ls_metric_prefix.config(text=f"🔍 Prefix: {prefix or '(none)'}")
+    q = queue.Queue(maxsize=16)
+
+    def post(item):
+        q.put(item)
+
     def worker():
-        try: client = get_client()
+        try:
+            _load_minio()
+            client = get_client()
         except Exception as e:
-            return root.after(0, lambda e=e: (
-                ls_tree.insert("", "end", values=("!", f"Client error: {e}"), tags=("error",)),
-                ls_btn.config(state="normal"),
-                statusbar.config(text="Ready"),
-                ls_summary.config(text=f"Client error: {e}"),
-            ))
+            return post({
+                "row": (("!", f"Client error: {e}"), "error"),
+                "status": "Ready",
+                "summary": f"Client error: {e}",
+                "done": True,
+            })
         try:
             if not client.bucket_exists(bucket):
-                return root.after(0, lambda: (
-                    ls_tree.insert("", "end", values=("—", "Bucket does not exist."), tags=("error",)),
-                    ls_btn.config(state="normal"),
-                    statusbar.config(text="Ready"),
-                    ls_summary.config(text="Bucket does not exist."),
-                ))
-            try:
-                iterator = client.list_objects(
-                    bucket,
-                    prefix=prefix,
-                    recursive=ls_recursive.get(),
-                    use_api="S3v2",
-                )
-            except TypeError:
-                iterator = client.list_objects(
-                    bucket,
-                    prefix=prefix,
-                    recursive=ls_recursive.get(),
-                )
-
-            count = 0
-            total_bytes = 0
+                return post({
+                    "row": (("—", "Bucket does not exist."), "error"),
+                    "status": "Ready",
+                    "summary": "Bucket does not exist.",
+                })
+            list_kwargs = {"prefix": prefix, "recursive": recursive}
+            if start_after and HAS_START_AFTER:
+                list_kwargs["start_after"] = start_after
+            if HAS_USE_API:
+                list_kwargs["use_api"] = "S3v2"
+            iterator = client.list_objects(bucket, **list_kwargs)
+
+            count = page["count"]
+            total_bytes = page["bytes"]
+            run_count = 0
+            last_name = None
             chunk = []
+            last_emit = time.time()
+            cancelled = False
+            capped = False
 
             def emit_chunk(rows):
-                def inner():
-                    for size_txt, name_txt in rows:
-                        ls_tree.insert("", "end", values=(size_txt, name_txt))
-                root.after(0, inner)
-
-            for obj in iterator:
-                name = getattr(obj, "object_name", None) or getattr(obj, "key", "")
-                size = getattr(obj, "size", 0) or 0
-                try:
-                    numeric_size = int(size)
-                except (TypeError, ValueError):
-                    numeric_size = 0
-                chunk.append((human_size(numeric_size), name))
-                count += 1
-                total_bytes += numeric_size
-                if len(chunk) >= 200:
-                    emit_chunk(chunk[:])
-                    chunk.clear()
+                # Blocks while the UI is behind; give up waiting on cancel.
+                item = (rows, count + run_count, total_bytes)
+                while True:
+                    try:
+                        q.put(item, timeout=0.25)
+                        return
+                    except queue.Full:
+                        if ls_cancel_event.is_set():
+                            return
+
+            # Local aliases keep attribute/global lookups out of the per-object loop.
+            get_name = attrgetter("object_name")
+            get_size = attrgetter("size")
+            is_cancelled = ls_cancel_event.is_set
+            clock = time.time
+            chunk_append = chunk.append
+            # Non-recursive pages can stop on a common prefix ("dir/"). S3 rebuilds
+            # prefixes from the keys after StartAfter, so it comes back first.
+            repeat_name = list_kwargs.get("start_after")
+            try:
+                for obj in iterator:
+                    if is_cancelled():
+                        cancelled = True
+                        break
+                    if run_count >= limit:
+                        # Stop after the "Objects per load" cap; resume on "Load more".
+                        capped = True
+                        break
+                    try:
+                        name = get_name(obj) or ""
+                    except AttributeError:
+                        name = getattr(obj, "key", "")
+                    if repeat_name is not None:
+                        repeated, repeat_name = name == repeat_name, None
+                        if repeated:
+                            continue
+                    try:
+                        numeric_size = int(get_size(obj) or 0)
+                    except (AttributeError, TypeError, ValueError):
+                        numeric_size = 0
+                    chunk_append((numeric_size, name))
+                    run_count += 1
+                    last_name = name
+                    total_bytes += numeric_size
+                    if len(chunk) >= 2000 or (len(chunk) >= 200 and clock() - last_emit >= 0.2):
+                        emit_chunk(chunk)
+                        chunk = []
+                        chunk_append = chunk.append
+                        last_emit = clock()
+            finally:
+                # Stop paging and release the pooled connection early on cancel.
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    try:
+                        close()
+                    except Exception:
+                        pass
 
             if chunk:
-                emit_chunk(chunk[:])
-
-            if count == 0:
+                emit_chunk(chunk)
+
+            count += run_count
+            page["count"], page["bytes"] = count, total_bytes
+            if capped:
+                summary = f"Showing first {count} objects • {human_size(total_bytes)} so far"
+                if HAS_START_AFTER:
+                    page["start_after"] = last_name
+                    summary += " • Load more to continue"
+                post({
+                    "status": summary,
+                    "summary": summary,
+                    "count": f"🧾 Objects: {count}+",
+                    "size": f"📦 Total size: {human_size(total_bytes)}+",
+                })
+            elif cancelled:
+                summary = f"Listing cancelled after {count} object{'s' if count != 1 else ''}"
+                summary += f" • {human_size(total_bytes)} so far"
+                post({
+                    "status": summary,
+                    "summary": summary,
+                    "count": f"🧾 Objects: {count}+",
+                    "size": f"📦 Total size: {human_size(total_bytes)}+",
+                })
+            elif count == 0:
                 summary = "No objects found."
                 if prefix:
                     summary += f" (prefix '{prefix}')"
-                root.after(0, lambda summary=summary: (
-                    ls_tree.insert("", "end", values=("—", summary), tags=("muted",)),
-                    statusbar.config(text=summary),
-                    ls_summary.config(text=summary),
-                    ls_metric_count.config(text="🧾 Objects: 0"),
-                    ls_metric_size.config(text="📦 Total size: 0 B"),
-                ))
+                post({
+                    "row": (("—", summary), "muted"),
+                    "status": summary,
+                    "summary": summary,
+                    "count": "🧾 Objects: 0",
+                    "size": "📦 Total size: 0 B",
+                })
             else:
                 summary = f"Listed {count} object{'s' if count != 1 else ''}"
                 if prefix:
                     summary += f" under '{prefix}'"
                 summary += f" • {human_size(total_bytes)} total"
-                root.after(0, lambda summary=summary: (
-                    statusbar.config(text=summary),
-                    ls_summary.config(text=summary),
-                    ls_metric_count.config(text=f"🧾 Objects: {count}"),
-                    ls_metric_size.config(text=f"📦 Total size: {human_size(total_bytes)}"),
-                ))
+                post({
+                    "status": summary,
+                    "summary": summary,
+                    "count": f"🧾 Objects: {count}",
+                    "size": f"📦 Total size: {human_size(total_bytes)}",
+                })
         except S3Error as e:
-            root.after(0, lambda e=e: (
-                ls_tree.insert("", "end", values=("!", f"S3 error: {e}"), tags=("error",)),
-                statusbar.config(text="Error"),
-                ls_summary.config(text=f"S3 error: {e}"),
-            ))
+            post({
+                "row": (("!", f"S3 error: {e}"), "error"),
+                "status": "Error",
+                "summary": f"S3 error: {e}",
+            })
         except Exception as e:
-            root.after(0, lambda e=e: (
-                ls_tree.insert("", "end", values=("!", f"Error: {e}"), tags=("error",)),
-                statusbar.config(text="Error"),
-                ls_summary.config(text=f"Error: {e}"),
-            ))
+            post({
+                "row": (("!", f"Error: {e}"), "error"),
+                "status": "Error",
+                "summary": f"Error: {e}",
+            })
         finally:
-            root.after(0, lambda: ls_btn.config(state="normal"))
+            post({"done": True})
+    root.after(50, _drain_ls_queue, q)
     threading.Thread(target=worker, daemon=True).start()
 
+def list_cancel():
+    ls_cancel_event.set()
+    ls_btn_cancel.config(state="disabled")
+    ls_summary.config(text="Cancelling listing…")
+    statusbar.config(text="Cancelling…")
+
 ls_btn.config(command=do_list)
+ls_btn_more.config(command=lambda: do_list(more=True))
+ls_btn_cancel.config(command=list_cancel)
 
 def do_delete_object():
     bucket = do_bucket.get().lower().strip()
@@ -4600,24 +5507,25 @@ def do_delete_object():
 
     def worker():
         try:
+            _load_minio()
             client = get_client()
         except Exception as e:
-            return root.after(0, lambda e=e: (
+            return _ui_post(lambda e=e: (
                 _update_textbox(do_status_text, f"Client error: {e}"),
                 do_btn.config(state="normal")
             ))
 
         try:
             client.remove_object(bucket, key)
-            root.after(0, lambda: _update_textbox(do_status_text, f"✅ Deleted object: {key}"))
+            _ui_post(_update_textbox, do_status_text, f"✅ Deleted object: {key}")
         except S3Error as e:
-            root.after(0, lambda e=e: (
+            _ui_post(lambda e=e: (
                 _update_textbox(do_status_text, f"S3 error: {e}"),
             ))
         except Exception as e:
-            root.after(0, lambda e=e: _update_textbox(do_status_text, f"Unexpected error: {e}"))
+            _ui_post(_update_textbox, do_status_text, f"Unexpected error: {e}")
         finally:
-            root.after(0, lambda: do_btn.config(state="normal"))
+            _ui_post(lambda: do_btn.config(state="normal"))
 
     threading.Thread(target=worker, daemon=True).start()
 
@@ -4646,10 +5554,10 @@ def do_delete_bucket():
 
     def worker():
         try:
+            _load_minio()
             client = get_client()
         except Exception as e:
-            return root.after(
-                0,
+            return _ui_post(
                 lambda e=e: (
                     _update_textbox(db_status_text, f"Client error: {e}"),
                     db_btn.config(state="normal")
@@ -4658,99 +5566,199 @@ def do_delete_bucket():
 
         try:
             # Force emptying if enabled
-            if db_force.get():
-                removed, errors = 0, 0
-                root.after(0, lambda: _update_textbox(db_status_text, "Emptying bucket before deletion…"))
+            if force_empty:
+                removed, errors, first_error = 0, 0, None
+                _ui_post_latest("db_status_text", _update_textbox, db_status_text, "Emptying bucket before deletion…")
 
-                try:
-                    iterator = client.list_objects(
-                        bucket,
-                        prefix=None,
-                        recursive=True,
-                        include_version=db_include_versions.get(),
-                    )
-                except TypeError:
+                list_kwargs = {"prefix": None, "recursive": True}
+                if HAS_INCLUDE_VERSION:
                     # Some clients (MinIO older versions) don't accept include_version
-                    iterator = client.list_objects(bucket, prefix=None, recursive=True)
+                    list_kwargs["include_version"] = include_versions
+                iterator = client.list_objects(bucket, **list_kwargs)
 
-                for obj in iterator:
-                    if cancel_event.is_set():
-                        break
-                    vid = getattr(obj, "version_id", None) if db_include_versions.get() else None
+                # Multi-object DeleteObjects requests of up to 1000 keys, a few
+                # in flight at once; listing keeps paging while batches run.
+                def delete_batch(batch):
                     try:
-                        client.remove_object(bucket, obj.object_name, version_id=vid)
-                        removed += 1
-                        if removed % 25 == 0:  # occasional UI feedback
-                            root.after(0, lambda r=removed: _update_textbox(
-                                db_status_text, f"🧹 Removed {r} objects so far…"))
+                        failed = list(client.remove_objects(bucket, batch))
                     except S3Error as e:
-                        errors += 1
-                        root.after(0, lambda e=e: _update_textbox(
-                            db_status_text, f"⚠️ Error deleting object: {e}"))
+                        return len(batch), len(batch), f"⚠️ Error deleting objects: {e}"
+                    if failed:
+                        first = failed[0]
+                        return len(batch), len(failed), f"⚠️ Error deleting {first.name}: {first.message or first.code}"
+                    return len(batch), 0, None
+
+                def collect(done):
+                    nonlocal removed, errors, first_error
+                    pass_error = None
+                    for fut in done:
+                        attempted, failed, err_msg = fut.result()
+                        removed += attempted - failed
+                        errors += failed
+                        if err_msg and pass_error is None:
+                            pass_error = err_msg
+                    if pass_error:
+                        # Leave the error up until the next pass's progress line.
+                        first_error = first_error or pass_error
+                        _ui_post_latest("db_status_text", _update_textbox, db_status_text, pass_error)
+                    else:
+                        _ui_post_latest("db_status_text", _update_textbox,
+                                        db_status_text, f"🧹 Removed {removed} objects so far…")
+
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    inflight = set()
+                    batch = []
+                    for obj in iterator:
+                        if cancel_event.is_set():
+                            break
+                        vid = getattr(obj, "version_id", None) if include_versions else None
+                        batch.append(DeleteObject(obj.object_name, vid))
+                        if len(batch) >= 1000:
+                            inflight.add(pool.submit(delete_batch, batch))
+                            batch = []
+                            if len(inflight) >= 16:
+                                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                                collect(done)
+                    if batch and not cancel_event.is_set():
+                        inflight.add(pool.submit(delete_batch, batch))
+                    if inflight:
+                        done, _ = wait(inflight)
+                        collect(done)
 
                 msg = f"Emptied {removed} objects"
                 if errors:
                     msg += f" with {errors} error(s)"
-                root.after(0, lambda msg=msg: _update_textbox(db_status_text, msg))
+                    if first_error:
+                        msg += f"\n{first_error}"
+                _ui_post_latest("db_status_text", _update_textbox, db_status_text, msg)
 
             # Proceed with actual deletion
-            root.after(0, lambda: _update_textbox(db_status_text, "Removing bucket…"))
+            _ui_post_latest("db_status_text", _update_textbox, db_status_text, "Removing bucket…")
             client.remove_bucket(bucket)
-            root.after(0, lambda: _update_textbox(db_status_text, f"✅ Bucket '{bucket}' deleted successfully."))
+            _ui_post_latest("db_status_text", _update_textbox, db_status_text, f"✅ Bucket '{bucket}' deleted successfully.")
 
         except S3Error as e:
-            root.after(0, lambda e=e: _update_textbox(db_status_text, f"S3 error: {e}"))
+            _ui_post_latest("db_status_text", _update_textbox, db_status_text, f"S3 error: {e}")
 
         except Exception as e:
-            root.after(0, lambda e=e: _update_textbox(db_status_text, f"Unexpected error: {e}"))
+            _ui_post_latest("db_status_text", _update_textbox, db_status_text, f"Unexpected error: {e}")
 
         finally:
-            root.after(0, lambda: db_btn.config(state="normal"))
+            _ui_post(lambda: db_btn.config(state="normal"))
 
+    force_empty = db_force.get()
+    include_versions = db_include_versions.get()
     threading.Thread(target=worker, daemon=True).start()
 
 db_btn.config(command=do_delete_bucket)
 
 
 # ---------------- shared UI helpers ----------------
-def _update_bar(bar, status_label, total, seen, _inst_unused=None, _avg_unused=None):
+def _update_bar(bar, status_label, total, seen, _inst_unused=None, _avg_unused=None, metrics=None):
     """Minimal, stable progress line:
        XX.X% | transferred / total | speed/s | ETA hh:mm:ss
+    metrics holds the speed samples; defaults to the status label's attributes.
     """
-    # Progressbar value
+    if metrics is None:
+        metrics = status_label.__dict__
+    # ~20 Hz cap: between refreshes only record the speed sample. The final
+    # update (seen >= total) always goes through.
+    now = time.time()
+    if (not total or seen < total) and now - getattr(status_label, "_last_bar_update", 0.0) < 0.05:
+        _speed_ring_push(_speed_ring(metrics), now, seen)
+        return
+    # Nothing moved since the last render (SDK re-reporting between chunks).
+    if seen == getattr(status_label, "_last_seen", -1) and (not total or seen < total):
+        return
+    status_label._last_bar_update = now
+    line_text, footer_text = _format_bar(metrics, total, seen)
+    _apply_bar(bar, status_label, total, seen, line_text, footer_text)
+    status_label._last_seen = seen
+
+def _apply_bar(bar, status_label, total, seen, line_text, footer_text=None):
+    """Tk-thread half of _update_bar: push preformatted text and the bar value."""
+    # Progressbar value; maximum only changes once per transfer
     if total:
-        if "maximum" not in bar.keys() or bar["maximum"] != total:
+        if getattr(bar, "_cur_max", None) != total:
             bar["maximum"] = total
-        bar["value"] = min(seen, total)
-    else:
-        bar["value"] = seen
+            bar._cur_max = total
+        value = min(seen, total)
+        # Steps under 0.1% are sub-pixel on any bar width; skip the redraw.
+        if value == total or abs(value - getattr(bar, "_last_value", 0)) * 1000 >= total:
+            bar["value"] = value
+            bar._last_value = value
+    # Without a total the bar runs indeterminate and animates on its own.
 
+    status_label.config(text=line_text)
+    if footer_text is not None:
+        try:
+            statusbar.config(text=footer_text)
+        except Exception:
+            pass
+
+# Speed history: fixed-size ring of (time, bytes) in two preallocated lists,
+# so sampling allocates nothing and trimming just advances the head index.
+_SPEED_RING_CAP = 256
+
+def _speed_ring(metrics):
+    ring = metrics.get("_speed_ring")
+    if ring is None:
+        ring = {"t": [0.0] * _SPEED_RING_CAP, "b": [0] * _SPEED_RING_CAP, "head": 0, "len": 0,
+                "head_t": 0.0, "t0": None, "b0": 0}
+        metrics["_speed_ring"] = ring
+    return ring
+
+def _speed_ring_push(ring, now, seen):
+    cap = _SPEED_RING_CAP
+    times = ring["t"]
+    head, count = ring["head"], ring["len"]
+    if ring["t0"] is None:
+        # first sample of the transfer, for the since-start average
+        ring["t0"], ring["b0"] = now, int(seen)
+    idx = (head + count) % cap
+    times[idx] = now
+    ring["b"][idx] = int(seen)
+    if count == 0:
+        ring["head_t"] = now
+    if count < cap:
+        count += 1
+    else:
+        head = (head + 1) % cap
+        ring["head_t"] = times[head]
+    # keep up to 5 seconds, but we’ll require >=1.5s for ETA; the cached head
+    # time skips the trim loop when nothing has expired
+    if now - ring["head_t"] > 5.0:
+        while count > 1 and (now - times[head]) > 5.0:
+            head = (head + 1) % cap
+            count -= 1
+        ring["head_t"] = times[head]
+    ring["head"], ring["len"] = head, count
+
+_BAR_LINE_FMT = "%5.1f%%  |  %s / %s  |  %s/s  |  ETA %s"
+_BAR_LINE_FMT_NO_TOTAL = "%s transferred  |  %s/s"
+
+def _format_bar(metrics, total, seen):
+    """Compute the progress line and (throttled) footer text without touching Tk,
+    so transfer workers can do the formatting off the UI thread. metrics is a
+    dict owned by the caller (the worker's context) for the speed samples."""
     # --- Sliding window speed (~1.5–5s of data) ---
     now = time.time()
-    hist = getattr(status_label, "_speed_hist", None)
-    if hist is None:
-        hist = deque()
-        status_label._speed_hist = hist
-
-    hist.append((now, int(seen)))
-    # keep up to 5 seconds, but we’ll require >=1.5s for ETA
-    while len(hist) > 1 and (now - hist[0][0]) > 5.0:
-        hist.popleft()
+    ring = _speed_ring(metrics)
+    _speed_ring_push(ring, now, seen)
+    times, sizes, head, count = ring["t"], ring["b"], ring["head"], ring["len"]
+    tail = (head + count - 1) % _SPEED_RING_CAP
 
     # window speed
     window_Bps = 0.0
-    if len(hist) >= 2:
-        t0, s0 = hist[0]
-        t1, s1 = hist[-1]
-        dt = max(t1 - t0, 1e-6)
-        window_Bps = max((s1 - s0) / dt, 0.0)
+    if count >= 2:
+        dt = max(times[tail] - times[head], 1e-6)
+        window_Bps = max((sizes[tail] - sizes[head]) / dt, 0.0)
 
     # early average (since transfer started)
-    first_t, first_s = hist[0]
-    elapsed = max(now - first_t, 1e-6)
-    early_avg_Bps = max((seen - first_s) / elapsed, 0.0)
+    elapsed = max(now - ring["t0"], 1e-6)
+    early_avg_Bps = max((seen - ring["b0"]) / elapsed, 0.0)
 
-    have_window = (now - first_t) >= 1.5 and window_Bps > 1.0  # need at least 1.5s of samples
+    have_window = (now - ring["head_t"]) >= 1.5 and window_Bps > 1.0  # need at least 1.5s of samples
 
     if have_window and early_avg_Bps > 0:
         # Blend window and overall averages to avoid jitter or unrealistic spikes
@@ -4768,33 +5776,35 @@ def _update_bar(bar, status_label, total, seen, _inst_unused=None, _avg_unused=N
 
     eta_seconds = None
     line_text = ""
+    speed_txt = human_size(effective_Bps)
     if total:
+        # total is fixed for a transfer; format it once per label.
+        cached_total = metrics.get("_total_fmt")
+        if cached_total is None or cached_total[0] != total:
+            cached_total = (total, human_size(total))
+            metrics["_total_fmt"] = cached_total
+        total_txt = cached_total[1]
         pct = 100.0 * (seen / max(total, 1))
         if effective_Bps > 1.0:
             eta_seconds = max(total - seen, 0) / effective_Bps
         eta_txt = human_eta(eta_seconds)
-        line_text = (
-            f"{pct:5.1f}%  |  {human_size(seen)} / {human_size(total)}"
-            f"  |  {human_size(effective_Bps)}/s  |  ETA {eta_txt}"
-        )
+        line_text = _BAR_LINE_FMT % (pct, human_size(seen), total_txt, speed_txt, eta_txt)
     else:
-        line_text = f"{human_size(seen)} transferred  |  {human_size(effective_Bps)}/s"
-
-    status_label.config(text=line_text)
+        line_text = _BAR_LINE_FMT_NO_TOTAL % (human_size(seen), speed_txt)
 
     # Optional: keep the bottom statusbar short (not a duplicate wall of text)
+    footer_text = None
     try:
         last = getattr(statusbar, "_last_upd", 0.0)
         if now - last > 0.5:
             if total:
-                pct = 100.0 * (seen / max(total, 1))
-                eta_txt = human_eta(eta_seconds)
-                statusbar.config(text=f"{pct:0.1f}%  •  {human_size(effective_Bps)}/s  •  ETA {eta_txt}")
+                footer_text = f"{pct:0.1f}%  •  {speed_txt}/s  •  ETA {eta_txt}"
             else:
-                statusbar.config(text=f"{human_size(seen)}  •  {human_size(effective_Bps)}/s")
+                footer_text = f"{human_size(seen)}  •  {speed_txt}/s"
             statusbar._last_upd = now
     except Exception:
         pass
+    return line_text, footer_text
 
 def _finish_err(status_label, msg):
     status_label.config(text="❌ Error")
@@ -4820,10 +5830,9 @@ def _rearm(start_btn, cancel_btn):
 def _update_textbox(widget, msg):
     """Safely update read-only Text boxes for wrapped multiline output."""
     if isinstance(widget, tk.Text):
+        text = _wrap_lines(msg, _cached_char_width(widget))
         widget.config(state="normal")
-        width = _estimate_char_width(widget)
-        widget.delete("1.0", tk.END)
-        widget.insert(tk.END, _wrap_lines(msg, width))
+        widget.replace("1.0", tk.END, text)
         widget.config(state="disabled")
         widget.see("end")
     else:
@@ -4834,5 +5843,19 @@ def _update_textbox(widget, msg):
 root.bind("<Command-o>", lambda e: pick_upload_file())
 
 # ---------------- Run ----------------
+# Import the SDK in the background once the window is up, so the first action
+# does not pay for it.
+def _prewarm_minio():
+    # The startup check only confirms the packages exist; an install that
+    # fails to import shows up here, so report it like a missing module.
+    try:
+        _load_minio()
+    except Exception as e:
+        _ui_post(messagebox.showerror, "MinIO SDK failed to load",
+                 f"The 'minio' package is installed but could not be imported:\n\n{e}\n\n"
+                 "Reinstall it with:\n    pip install --force-reinstall minio")
+
+root.after(300, lambda: threading.Thread(target=_prewarm_minio, daemon=True).start())
+
 if __name__ == "__main__":
     root.mainloop()
\ No newline at end of file
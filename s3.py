@@ -14,16 +14,58 @@ Env:
 """
 
 import argparse
+import inspect
 import json
 import os
 import stat
 import sys
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
-from minio import Minio
-from minio.error import S3Error
-from tqdm import tqdm
 
+# minio and tqdm are imported on first use (_load_sdk) so importing this
+# module for its settings helpers stays cheap. app.py calls the same loader.
+class _SdkNotLoaded(Exception):
+    """Stand-in for S3Error until the minio SDK has been imported, so
+    `except S3Error` stays valid before _load_sdk() runs."""
+
+
+Minio = None
+S3Error = _SdkNotLoaded
+DeleteObject = None
+tqdm = None
+HAS_USE_API = HAS_INCLUDE_VERSION = HAS_START_AFTER = HAS_BUCKET_LOOKUP = False
+_sdk_lock = threading.Lock()
+
+
+def _load_sdk():
+    global Minio, S3Error, DeleteObject, tqdm
+    global HAS_USE_API, HAS_INCLUDE_VERSION, HAS_START_AFTER, HAS_BUCKET_LOOKUP
+    if Minio is not None:
+        return
+    with _sdk_lock:
+        if Minio is not None:
+            return
+        from minio import Minio as _Minio
+        from minio.error import S3Error as _S3Error
+        from minio.deleteobjects import DeleteObject as _DeleteObject
+        from tqdm import tqdm as _tqdm
+        # list_objects keywords differ across minio releases; check the
+        # signature once rather than retrying each call on TypeError.
+        try:
+            params = inspect.signature(_Minio.list_objects).parameters
+        except (TypeError, ValueError):
+            params = {}
+        HAS_USE_API = "use_api" in params
+        HAS_INCLUDE_VERSION = "include_version" in params
+        HAS_START_AFTER = "start_after" in params
+        # Only some minio releases accept Minio(bucket_lookup=...).
+        try:
+            HAS_BUCKET_LOOKUP = "bucket_lookup" in inspect.signature(_Minio).parameters
+        except (TypeError, ValueError):
+            HAS_BUCKET_LOOKUP = False
+        S3Error, DeleteObject, tqdm = _S3Error, _DeleteObject, _tqdm
+        Minio = _Minio
 
 
 # ---------- Helpers ----------
@@ -53,6 +95,7 @@ class ProgressFile(object):
 
 
 def get_client():
+    _load_sdk()
     endpoint = os.environ.get("MINIO_ENDPOINT")
     access_key = os.environ.get("MINIO_ACCESS_KEY")
     secret_key = os.environ.get("MINIO_SECRET_KEY")
@@ -80,7 +123,53 @@ def _resolve_setting(env_key: str, settings: Dict[str, Any], default: Optional[s
     return default
 
 
-def get_client3():
+# One urllib3 pool shared by every client get_client3() builds, so keep-alive
+# connections survive a settings change; the client itself is reused until the
+# resolved connection settings differ.
+_http_pool = None
+_client_lock = threading.Lock()
+_client_cache = {"key": None, "client": None}
+
+
+def _shared_http_client():
+    global _http_pool
+    if _http_pool is not None:
+        return _http_pool
+    with _client_lock:
+        if _http_pool is not None:
+            return _http_pool
+        import certifi
+        import urllib3
+        timeout = 300
+        # Bucket emptying runs 8 delete workers next to listing and multipart
+        # uploads; size the per-host pool so none of them has to reconnect.
+        _http_pool = urllib3.PoolManager(
+            timeout=urllib3.util.Timeout(connect=timeout, read=timeout),
+            num_pools=4,
+            maxsize=32,
+            block=False,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.util.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+    return _http_pool
+
+
+def reset_client():
+    """Drop the cached client so the next get_client3() call rebuilds it."""
+    with _client_lock:
+        _client_cache["key"] = None
+        _client_cache["client"] = None
+
+
+def get_client3(wrap_http=None):
+    """Return a client for the saved settings. wrap_http, if given, wraps the
+    shared HTTP client for this one client, which is then not cached."""
+    _load_sdk()
     settings = load_settings()
 
     provider = settings.get("PROVIDER", "aws")
@@ -106,6 +195,12 @@ def get_client3():
         print("Missing required configuration value(s): " + ", ".join(missing), file=sys.stderr)
         sys.exit(2)
 
+    cache_key = (endpoint, access_key, secret_key, region, secure, path_style)
+    if wrap_http is None:
+        with _client_lock:
+            if _client_cache["client"] is not None and _client_cache["key"] == cache_key:
+                return _client_cache["client"]
+
     http_client = None
     if secure and ca_cert:
         try:
@@ -117,6 +212,15 @@ def get_client3():
             http_client = PoolManager(cert_reqs=ssl.CERT_REQUIRED,ca_certs=ca_cert)
 
 
+    if http_client is None:
+        try:
+            http_client = _shared_http_client()
+        except Exception:
+            http_client = None
+
+    if http_client is not None and wrap_http is not None:
+        http_client = wrap_http(http_client)
+
     minio_kwargs = dict(
         access_key=access_key,
         secret_key=secret_key,
@@ -125,13 +229,18 @@ def get_client3():
         http_client=http_client,
     )
 
-    bucket_lookup_mode = "path" if path_style else "auto"
+    # Older MinIO SDKs do not accept the bucket_lookup argument.
+    if HAS_BUCKET_LOOKUP:
+        minio_kwargs["bucket_lookup"] = "path" if path_style else "auto"
 
-    try:
-        return Minio(endpoint, bucket_lookup=bucket_lookup_mode, **minio_kwargs)
-    except TypeError:
-        # Older MinIO SDKs (< 7.2.5) do not accept the bucket_lookup argument.
-        return Minio(endpoint, **minio_kwargs)
+    client = Minio(endpoint, **minio_kwargs)
+    if wrap_http is not None:
+        return client
+
+    with _client_lock:
+        _client_cache["key"] = cache_key
+        _client_cache["client"] = client
+    return client
 
 
 def ensure_bucket(client, bucket, region=None):
@@ -388,6 +497,7 @@ def build_parser():
 
 
 def main():
+    _load_sdk()
     parser = build_parser()
     args = parser.parse_args()
     args.func(args)